@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
 from functools import partial
 from typing import TYPE_CHECKING
 
-from homeassistant.components.mqtt.client import async_subscribe
 from homeassistant.components.mqtt.util import async_wait_for_mqtt_client
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CoreState, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.start import async_at_started
 
 from .const import (
     CONF_SCREEN_TYPE_NAME,
@@ -17,38 +22,112 @@ from .const import (
     DOMAIN,
     XDisplayScreenTypes,
 )
+from .models import XDisplayData
+from .mqtt import XDisplayMqttClient
+from .services import async_setup_services
 from .sync.button import XDisplayButtonSync
+from .sync.consumption import XDisplayConsumptionSync
 from .sync.cover import XDisplayCoverSync
 from .sync.energy import XDisplayEnergySync
+from .sync.four_buttons import XDisplayFourButtonsSync
+from .sync.home import XDisplayHomeSync
+from .sync.keyboard import XDisplayKeyboardSync
 from .sync.media_player import XDisplayMediaPlayerSync
 from .sync.sensor import XDisplaySensorSync
+from .sync.slider import XDisplaySliderSync
 from .sync.thermostat import XDisplayThermostatSync
 from .sync.weather import XDisplayWeatherSync
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
+
+    from .sync import XDisplaySync
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 PLATFORMS = [Platform.SENSOR, Platform.SWITCH, Platform.NUMBER]
 
+# Maximum delay to start the screens syncs after Home Assistant started
+STARTUP_JITTER = 15
+
 _LOGGER = logging.getLogger(__name__)
 
 
-async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:  # noqa: PLR0912
+async def async_setup(hass: HomeAssistant, _: ConfigType) -> bool:
+    """Set up the component."""
+    async_setup_services(hass)
+    return True
+
+
+async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Set up entry."""
     hass.data.setdefault(DOMAIN, {})
 
     if not await async_wait_for_mqtt_client(hass):
-        _LOGGER.error("MQTT integration is not available")
-        return False
+        raise ConfigEntryNotReady("MQTT integration is not available")  # noqa: EM101, TRY003
     _LOGGER.debug("MQTT available")
 
-    config = config_entry.data
+    data = XDisplayData(mqtt=XDisplayMqttClient(hass, config_entry))
+    await data.mqtt.async_load()
+    await data.mqtt.async_track_screen_off()
+    data.mqtt.async_track_connection()
+    data.mqtt.async_track_pacing()
+    hass.data[DOMAIN][config_entry.entry_id] = data
 
     # Create base entities
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
 
-    # Create screens pub and sub topics
+    # Create screens pub and sub topics once Home Assistant has started,
+    # spread over a few seconds to not start all X-Display at the same time.
+    # Already running (reload), there is no startup burst to spread.
+    jitter = hass.state is not CoreState.running
+
+    @callback
+    def async_start_syncs_later(_: datetime | None = None) -> None:
+        """Start the screens syncs."""
+        config_entry.async_create_background_task(
+            hass, async_start_syncs(hass, config_entry), "start screens syncs"
+        )
+
+    @callback
+    def async_started(_: HomeAssistant) -> None:
+        """Schedule the screens syncs start."""
+        if not jitter:
+            async_start_syncs_later()
+            return
+        config_entry.async_on_unload(
+            async_call_later(
+                hass,
+                random.uniform(0, STARTUP_JITTER),  # noqa: S311
+                async_start_syncs_later,
+            )
+        )
+
+    config_entry.async_on_unload(async_at_started(hass, async_started))
+    return True
+
+
+async def async_start_syncs(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Create the screens syncs and publish their current state."""
+    data: XDisplayData = hass.data[DOMAIN][config_entry.entry_id]
+    data.syncs = await async_setup_syncs(hass, config_entry)
+
+    # Only publish what changed since the X-Display was last updated
+    with data.mqtt.diff_only():
+        await asyncio.gather(*(sync.async_refresh() for sync in data.syncs))
+
+
+async def async_setup_syncs(  # noqa: PLR0912, PLR0915
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> list[XDisplaySync]:
+    """Create the sync of each configured screen."""
+    config = config_entry.data
+    syncs: list[XDisplaySync] = []
+
     if len(config[CONF_SCREENS]) == 0:
         _LOGGER.error("No screens configured")
     for screen_id, screen_options in enumerate(config[CONF_SCREENS]):
@@ -60,20 +139,44 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
                 screen_id,
                 screen_options,
             )
-            await async_subscribe(
-                hass=hass,
-                topic=button_sync.topic_sub,
-                msg_callback=button_sync.update_entity,
+            await button_sync.async_subscribe(
+                button_sync.topic_sub,
+                button_sync.update_entity,
+            )
+            syncs.append(button_sync)
+        elif (
+            screen_options[CONF_SCREEN_TYPE_NAME]
+            == XDisplayScreenTypes.FOUR_BUTTONS.name
+        ):
+            four_buttons_sync = XDisplayFourButtonsSync(
+                hass, config_entry, screen_id, screen_options
+            )
+            for index, topic in enumerate(four_buttons_sync.topics_sub):
+                await four_buttons_sync.async_subscribe(
+                    topic, partial(four_buttons_sync.update_entity, index=index)
+                )
+            syncs.append(four_buttons_sync)
+        elif screen_options[CONF_SCREEN_TYPE_NAME] == XDisplayScreenTypes.SLIDER.name:
+            slider_sync = XDisplaySliderSync(
+                hass, config_entry, screen_id, screen_options
+            )
+            await slider_sync.async_subscribe(
+                slider_sync.topic_sub, slider_sync.update_entity
             )
+            syncs.append(slider_sync)
         elif screen_options[CONF_SCREEN_TYPE_NAME] == XDisplayScreenTypes.COVER.name:
             cover_sync = XDisplayCoverSync(
                 hass, config_entry, screen_id, screen_options
             )
-            await async_subscribe(
-                hass=hass,
-                topic=cover_sync.sub_topic_position,
-                msg_callback=cover_sync.update_entity,
+            await cover_sync.async_subscribe(
+                cover_sync.sub_topic_position,
+                cover_sync.update_entity,
+            )
+            await cover_sync.async_subscribe(
+                cover_sync.sub_topic_set_position,
+                partial(cover_sync.update_entity, action="set_cover_position"),
             )
+            syncs.append(cover_sync)
         elif (
             screen_options[CONF_SCREEN_TYPE_NAME] == XDisplayScreenTypes.THERMOSTAT.name
         ):
@@ -81,86 +184,98 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
                 hass, config_entry, screen_id, screen_options
             )
 
-            await async_subscribe(
-                hass=hass,
-                topic=thermostat_sync.sub_topic_target_temp,
-                msg_callback=partial(
-                    thermostat_sync.update_entity, action="set_temperature"
-                ),
+            await thermostat_sync.async_subscribe(
+                thermostat_sync.sub_topic_target_temp,
+                partial(thermostat_sync.update_entity, action="set_temperature"),
             )
-            await async_subscribe(
-                hass=hass,
-                topic=thermostat_sync.sub_topic_turned_on,
-                msg_callback=partial(
-                    thermostat_sync.update_entity, action="set_hvac_mode"
-                ),
+            await thermostat_sync.async_subscribe(
+                thermostat_sync.sub_topic_turned_on,
+                partial(thermostat_sync.update_entity, action="set_hvac_mode"),
             )
+            syncs.append(thermostat_sync)
         elif (
             screen_options[CONF_SCREEN_TYPE_NAME]
             == XDisplayScreenTypes.TEMPERATURE.name
         ):
-            XDisplaySensorSync(hass, config_entry, screen_id, screen_options, "temp")
+            syncs.append(
+                XDisplaySensorSync(
+                    hass, config_entry, screen_id, screen_options, "temp"
+                )
+            )
         elif screen_options[CONF_SCREEN_TYPE_NAME] == XDisplayScreenTypes.HUMIDITY.name:
-            XDisplaySensorSync(hass, config_entry, screen_id, screen_options, "hum")
+            syncs.append(
+                XDisplaySensorSync(hass, config_entry, screen_id, screen_options, "hum")
+            )
         elif (
             screen_options[CONF_SCREEN_TYPE_NAME] == XDisplayScreenTypes.LUMINOSITY.name
         ):
-            XDisplaySensorSync(hass, config_entry, screen_id, screen_options, "lum")
+            syncs.append(
+                XDisplaySensorSync(hass, config_entry, screen_id, screen_options, "lum")
+            )
         elif screen_options[CONF_SCREEN_TYPE_NAME] == XDisplayScreenTypes.WEATHER.name:
-            XDisplayWeatherSync(hass, config_entry, screen_id, screen_options)
+            syncs.append(
+                XDisplayWeatherSync(hass, config_entry, screen_id, screen_options)
+            )
+        elif (
+            screen_options[CONF_SCREEN_TYPE_NAME]
+            == XDisplayScreenTypes.CONSUMPTION.name
+        ):
+            syncs.append(
+                XDisplayConsumptionSync(hass, config_entry, screen_id, screen_options)
+            )
         elif screen_options[CONF_SCREEN_TYPE_NAME] == XDisplayScreenTypes.PLAYER.name:
             player_sync = XDisplayMediaPlayerSync(
                 hass, config_entry, screen_id, screen_options
             )
-            await async_subscribe(
-                hass=hass,
-                topic=player_sync.sub_topic_vol_down,
-                msg_callback=partial(player_sync.update_entity, action="volume_down"),
-            )
-            await async_subscribe(
-                hass=hass,
-                topic=player_sync.sub_topic_vol_up,
-                msg_callback=partial(player_sync.update_entity, action="volume_up"),
-            )
-            await async_subscribe(
-                hass=hass,
-                topic=player_sync.sub_topic_mute,
-                msg_callback=partial(player_sync.update_entity, action="volume_mute"),
-            )
-            await async_subscribe(
-                hass=hass,
-                topic=player_sync.sub_topic_next,
-                msg_callback=partial(
-                    player_sync.update_entity, action="media_next_track"
-                ),
-            )
-            await async_subscribe(
-                hass=hass,
-                topic=player_sync.sub_topic_prev,
-                msg_callback=partial(
-                    player_sync.update_entity, action="media_previous_track"
-                ),
-            )
-            await async_subscribe(
-                hass=hass,
-                topic=player_sync.sub_topic_pause,
-                msg_callback=partial(
-                    player_sync.update_entity, action="media_play_pause"
-                ),
-            )
-            await async_subscribe(
-                hass=hass,
-                topic=player_sync.sub_topic_loop,
-                msg_callback=partial(player_sync.update_entity, action="repeat_set"),
-            )
-            await async_subscribe(
-                hass=hass,
-                topic=player_sync.sub_topic_random,
-                msg_callback=partial(player_sync.update_entity, action="shuffle_set"),
+            await player_sync.async_subscribe(
+                player_sync.sub_topic_vol_down,
+                partial(player_sync.update_entity, action="volume_down"),
+            )
+            await player_sync.async_subscribe(
+                player_sync.sub_topic_vol_up,
+                partial(player_sync.update_entity, action="volume_up"),
+            )
+            await player_sync.async_subscribe(
+                player_sync.sub_topic_mute,
+                partial(player_sync.update_entity, action="volume_mute"),
+            )
+            await player_sync.async_subscribe(
+                player_sync.sub_topic_next,
+                partial(player_sync.update_entity, action="media_next_track"),
+            )
+            await player_sync.async_subscribe(
+                player_sync.sub_topic_prev,
+                partial(player_sync.update_entity, action="media_previous_track"),
+            )
+            await player_sync.async_subscribe(
+                player_sync.sub_topic_pause,
+                partial(player_sync.update_entity, action="media_play_pause"),
+            )
+            await player_sync.async_subscribe(
+                player_sync.sub_topic_loop,
+                partial(player_sync.update_entity, action="repeat_set"),
+            )
+            await player_sync.async_subscribe(
+                player_sync.sub_topic_random,
+                partial(player_sync.update_entity, action="shuffle_set"),
+            )
+            syncs.append(player_sync)
+        elif screen_options[CONF_SCREEN_TYPE_NAME] == XDisplayScreenTypes.HOME.name:
+            syncs.append(
+                XDisplayHomeSync(hass, config_entry, screen_id, screen_options)
+            )
+        elif screen_options[CONF_SCREEN_TYPE_NAME] == XDisplayScreenTypes.KEYBOARD.name:
+            keyboard_sync = XDisplayKeyboardSync(
+                hass, config_entry, screen_id, screen_options
+            )
+            await keyboard_sync.async_subscribe(
+                keyboard_sync.topic_sub, keyboard_sync.update_entity
             )
+            syncs.append(keyboard_sync)
         elif screen_options[CONF_SCREEN_TYPE_NAME] == XDisplayScreenTypes.ENERGY.name:
             energy = XDisplayEnergySync(hass, config_entry, screen_id, screen_options)
             await energy.initialize()
+            syncs.append(energy)
         else:
             _LOGGER.info(
                 "Screen #%s: %s is not supported or not implemented",
@@ -168,9 +283,18 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
                 screen_options[CONF_SCREEN_TYPE_NAME],
             )
 
-    return True
+    return syncs
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    data: XDisplayData = hass.data[DOMAIN][entry.entry_id]
+    await data.mqtt.async_stop_capture()
+    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        hass.data[DOMAIN].pop(entry.entry_id)
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the data stored for a config entry."""
+    await XDisplayMqttClient(hass, entry).async_remove()
@@ -0,0 +1,168 @@
+"""Capture of X-Display traffic for GCE X-Display V2 integration."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import time
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    async_track_time_interval,
+)
+from homeassistant.util import dt as dt_util
+
+from .const import CONF_PREFIX_TOPIC, CONF_SCREENS
+from .sync import linked_entity_ids
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from pathlib import Path
+
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import (
+        CALLBACK_TYPE,
+        Event,
+        EventStateChangedData,
+        HomeAssistant,
+        State,
+    )
+
+_LOGGER = logging.getLogger(__name__)
+
+CAPTURE_VERSION = 1
+CAPTURE_FLUSH_INTERVAL = timedelta(seconds=10)
+DIRECTION_STATE = "s"
+
+
+class XDisplayCapture:
+    """
+    Record X-Display traffic to a gzipped JSON lines file.
+
+    The first line is a header holding the screens configuration and the
+    linked entity states at capture start. Each next line is a
+    `[time, direction, topic or entity id, payload or state]` record, with
+    the state attributes appended for linked entity state changes.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, config_entry: ConfigEntry, path: Path
+    ) -> None:
+        """Initialize the capture."""
+        self.hass = hass
+        self.config_entry = config_entry
+        self.path = path
+        self.count = 0
+
+        self._start = time.monotonic()
+        self._records: list[Any] = []
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_start(self) -> None:
+        """Start recording, with current state of linked entities."""
+        screens = self.config_entry.data[CONF_SCREENS]
+        entity_ids = sorted(
+            {entity_id for screen in screens for entity_id in linked_entity_ids(screen)}
+        )
+        states = {
+            entity_id: [state.state, dict(state.attributes)]
+            for entity_id in entity_ids
+            if (state := self.hass.states.get(entity_id)) is not None
+        }
+        self._start = time.monotonic()
+        self._records.append(
+            {
+                "version": CAPTURE_VERSION,
+                "started": dt_util.utcnow().isoformat(),
+                CONF_PREFIX_TOPIC: self.config_entry.data[CONF_PREFIX_TOPIC],
+                CONF_SCREENS: screens,
+                "states": states,
+            }
+        )
+
+        self._unsubs = [
+            async_track_state_change_event(
+                self.hass, entity_ids, self._async_state_changed
+            ),
+            async_track_time_interval(
+                self.hass, self._async_flush_interval, CAPTURE_FLUSH_INTERVAL
+            ),
+        ]
+        _LOGGER.info("Capturing X-Display traffic to %s", self.path)
+
+    async def async_stop(self) -> None:
+        """Stop recording and write pending records."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
+        await self.async_flush()
+        _LOGGER.info("Captured %s records to %s", self.count, self.path)
+
+    @callback
+    def record(self, direction: str, key: str, value: Any) -> None:
+        """Record a message."""
+        if isinstance(value, bytes | bytearray):
+            value = value.decode("utf-8", errors="replace")
+        self._records.append([self._now(), direction, key, value])
+        self.count += 1
+
+    @callback
+    def record_state(self, entity_id: str, state: State | None) -> None:
+        """Record a linked entity state."""
+        if state is None:
+            self._records.append([self._now(), DIRECTION_STATE, entity_id, None])
+        else:
+            self._records.append(
+                [
+                    self._now(),
+                    DIRECTION_STATE,
+                    entity_id,
+                    state.state,
+                    dict(state.attributes),
+                ]
+            )
+        self.count += 1
+
+    def _now(self) -> float:
+        """Return seconds since capture start."""
+        return round(time.monotonic() - self._start, 4)
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Record linked entity state change."""
+        self.record_state(event.data["entity_id"], event.data["new_state"])
+
+    async def _async_flush_interval(self, _: datetime) -> None:
+        """Write pending records on schedule."""
+        await self.async_flush()
+
+    async def async_flush(self) -> None:
+        """Write pending records."""
+        if not self._records:
+            return
+        records, self._records = self._records, []
+        await self.hass.async_add_executor_job(self._write, records)
+
+    def _write(self, records: list[Any]) -> None:
+        """Append records to the capture file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(self.path, "at", encoding="utf-8") as file:
+            file.writelines(
+                json.dumps(record, separators=(",", ":"), default=str) + "\n"
+                for record in records
+            )
+
+
+def load_capture(path: Path) -> tuple[dict[str, Any], list[list[Any]]]:
+    """Read a capture file, return its header and records."""
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        header, *records = (json.loads(line) for line in file if line.strip())
+    if header.get("version") != CAPTURE_VERSION:
+        msg = f"Unsupported capture version: {header.get('version')}"
+        raise ValueError(msg)
+    return header, records
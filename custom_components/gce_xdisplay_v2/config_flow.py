@@ -19,25 +19,47 @@ from homeassistant.config_entries import (
 )
 from homeassistant.const import CONF_DEVICE_ID, CONF_NAME
 from homeassistant.core import callback
+from homeassistant.exceptions import TemplateError
+from homeassistant.helpers import area_registry as ar
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import selector
+from homeassistant.helpers.template import Template
 
 from .const import (
+    AGGREGATE_MAX,
+    AGGREGATE_MEAN,
+    AGGREGATE_MIN,
     CONF_PREFIX_TOPIC,
+    CONF_SCREEN_AGGREGATE,
+    CONF_SCREEN_AREA,
+    CONF_SCREEN_DEADBAND,
+    CONF_SCREEN_DEADBAND_MODE,
     CONF_SCREEN_ID,
     CONF_SCREEN_LINKED_ENTITY,
+    CONF_SCREEN_PRECISION,
+    CONF_SCREEN_TEMPLATE,
     CONF_SCREEN_TYPE_NAME,
     CONF_SCREENS,
+    CONF_TOPIC_POLICIES,
+    DEADBAND_MODE_ABSOLUTE,
+    DEADBAND_MODE_RELATIVE,
     DOMAIN,
+    MAX_SCREEN_COUNT,
     XDISPLAY_SCREEN_TYPE_DEVICE_CLASSES,
     XDISPLAY_SCREEN_TYPE_DOMAINS,
+    XDISPLAY_SCREEN_TYPE_MULTIPLE_ENTITIES,
+    XDISPLAY_SENSOR_SCREEN_TYPES,
     XDisplayScreenTypes,
 )
 from .mqtt import (
     xdisplay_mqtt_add_screen,
+    xdisplay_mqtt_add_screens,
     xdisplay_mqtt_delete_last_screen,
     xdisplay_mqtt_update_screen_name,
 )
+from .policy import TOPIC_POLICIES_SCHEMA
+from .sync import linked_entity_ids
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigFlowResult
@@ -52,6 +74,75 @@ DATA_SCHEMA = vol.Schema(
 )
 
 
+def _single_linked_entity(screen: dict[str, Any]) -> dict[str, Any]:
+    """Store the entity of a single entity screen type as a string."""
+    screen_type = screen[CONF_SCREEN_TYPE_NAME]
+    linked_entity = screen.get(CONF_SCREEN_LINKED_ENTITY)
+    if screen_type in XDISPLAY_SCREEN_TYPE_MULTIPLE_ENTITIES or not isinstance(
+        linked_entity, list
+    ):
+        return screen
+    if len(linked_entity) != 1:
+        msg = f"{screen_type} screens link a single entity"
+        raise vol.Invalid(msg, path=[CONF_SCREEN_LINKED_ENTITY])
+    return screen | {CONF_SCREEN_LINKED_ENTITY: linked_entity[0]}
+
+
+BULK_SCREENS_SCHEMA = vol.All(
+    cv.ensure_list,
+    [
+        vol.All(
+            vol.Schema(
+                {
+                    vol.Required(CONF_SCREEN_TYPE_NAME): vol.In(
+                        [t.name for t in XDisplayScreenTypes]
+                    ),
+                    vol.Optional(CONF_NAME): cv.string,
+                    vol.Optional(CONF_SCREEN_LINKED_ENTITY): vol.Any(
+                        cv.entity_id, cv.entity_ids
+                    ),
+                    vol.Optional(CONF_SCREEN_TEMPLATE): cv.string,
+                    vol.Optional(CONF_SCREEN_AGGREGATE): vol.In(
+                        [AGGREGATE_MEAN, AGGREGATE_MIN, AGGREGATE_MAX]
+                    ),
+                    vol.Optional(CONF_SCREEN_PRECISION): vol.All(
+                        vol.Coerce(int), vol.Range(min=0, max=3)
+                    ),
+                    vol.Optional(CONF_SCREEN_DEADBAND): vol.All(
+                        vol.Coerce(float), vol.Range(min=0)
+                    ),
+                    vol.Optional(CONF_SCREEN_DEADBAND_MODE): vol.In(
+                        [DEADBAND_MODE_ABSOLUTE, DEADBAND_MODE_RELATIVE]
+                    ),
+                    vol.Optional(CONF_SCREEN_AREA): cv.string,
+                }
+            ),
+            _single_linked_entity,
+        )
+    ],
+)
+
+
+def _screen_options(screen_type: str, user_input: dict[str, Any]) -> dict[str, Any]:
+    """Return the options stored for a screen."""
+    screen_options = {
+        CONF_SCREEN_TYPE_NAME: screen_type,
+        CONF_SCREEN_LINKED_ENTITY: user_input.get(CONF_SCREEN_LINKED_ENTITY),
+        CONF_NAME: user_input.get(CONF_NAME),
+    }
+    for key in (
+        CONF_SCREEN_TEMPLATE,
+        CONF_SCREEN_AGGREGATE,
+        CONF_SCREEN_PRECISION,
+        CONF_SCREEN_DEADBAND,
+        CONF_SCREEN_DEADBAND_MODE,
+        CONF_SCREEN_AREA,
+    ):
+        if key in user_input:
+            screen_options[key] = user_input[key]
+    return screen_options
+
+
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Hello World."""
 
@@ -121,8 +212,10 @@ class XdisplayOptionsFlowHandler(OptionsFlow):
             step_id="init",
             menu_options={
                 "add_screen": "Add a screen",
+                "add_screens_bulk": "Add several screens",
                 "update_screen": "Edit a screen",
                 "remove_last_screen": "Remove last screen",
+                "topic_policies": "Edit QoS and retain of topics",
             },
         )
 
@@ -169,17 +262,67 @@ class XdisplayOptionsFlowHandler(OptionsFlow):
             devices_classes = XDISPLAY_SCREEN_TYPE_DEVICE_CLASSES.get(
                 self.user_input[CONF_SCREEN_TYPE_NAME]
             )
+            multiple = (
+                self.user_input[CONF_SCREEN_TYPE_NAME]
+                in XDISPLAY_SCREEN_TYPE_MULTIPLE_ENTITIES
+            )
             if devices_classes:
                 selector_config = selector.EntitySelectorConfig(
-                    domain=domains, device_class=devices_classes
+                    domain=domains, device_class=devices_classes, multiple=multiple
                 )
             else:
-                selector_config = selector.EntitySelectorConfig(domain=domains)
+                selector_config = selector.EntitySelectorConfig(
+                    domain=domains, multiple=multiple
+                )
+
+            # Sensor screens can show a template, home screens an area,
+            # instead of entities
+            linked_entity_key = (
+                vol.Optional
+                if self.user_input[CONF_SCREEN_TYPE_NAME]
+                in [*XDISPLAY_SENSOR_SCREEN_TYPES, XDisplayScreenTypes.HOME.name]
+                else vol.Required
+            )
+            data_schema = data_schema.extend(
+                {
+                    linked_entity_key(
+                        CONF_SCREEN_LINKED_ENTITY
+                    ): selector.EntitySelector(selector_config),
+                }
+            )
+
+        if self.user_input[CONF_SCREEN_TYPE_NAME] == XDisplayScreenTypes.HOME.name:
+            data_schema = data_schema.extend(
+                {vol.Optional(CONF_SCREEN_AREA): selector.AreaSelector()}
+            )
 
+        if self.user_input[CONF_SCREEN_TYPE_NAME] in XDISPLAY_SENSOR_SCREEN_TYPES:
             data_schema = data_schema.extend(
                 {
-                    vol.Required(CONF_SCREEN_LINKED_ENTITY): selector.EntitySelector(
-                        selector_config
+                    vol.Optional(CONF_SCREEN_TEMPLATE): selector.TemplateSelector(),
+                    vol.Optional(
+                        CONF_SCREEN_AGGREGATE, default=AGGREGATE_MEAN
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=[AGGREGATE_MEAN, AGGREGATE_MIN, AGGREGATE_MAX]
+                        )
+                    ),
+                    vol.Optional(CONF_SCREEN_PRECISION): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0, max=3, step=1, mode=selector.NumberSelectorMode.BOX
+                        )
+                    ),
+                    vol.Optional(CONF_SCREEN_DEADBAND): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0, step="any", mode=selector.NumberSelectorMode.BOX
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_SCREEN_DEADBAND_MODE, default=DEADBAND_MODE_ABSOLUTE
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=[DEADBAND_MODE_ABSOLUTE, DEADBAND_MODE_RELATIVE]
+                        )
                     ),
                 }
             )
@@ -191,16 +334,10 @@ class XdisplayOptionsFlowHandler(OptionsFlow):
                 errors=errors,
             )
 
-        if domains:
-            if self.hass.states.get(user_input[CONF_SCREEN_LINKED_ENTITY]) is None:
-                errors["base"] = "entity_not_found"
-            if (
-                user_input[CONF_SCREEN_LINKED_ENTITY].split(".")[0]
-                not in XDISPLAY_SCREEN_TYPE_DOMAINS[
-                    self.user_input[CONF_SCREEN_TYPE_NAME]
-                ]
-            ):
-                errors["base"] = "entity_wrong_domain"
+        if error := self._validate_screen_sources(
+            self.user_input[CONF_SCREEN_TYPE_NAME], user_input
+        ):
+            errors["base"] = error
 
         if errors:
             return self.async_show_form(
@@ -229,11 +366,7 @@ class XdisplayOptionsFlowHandler(OptionsFlow):
 
         self.update_screen_config_data(
             screen_id=None,
-            options={
-                CONF_SCREEN_TYPE_NAME: self.user_input[CONF_SCREEN_TYPE_NAME],
-                CONF_SCREEN_LINKED_ENTITY: user_input.get(CONF_SCREEN_LINKED_ENTITY),
-                CONF_NAME: user_input.get(CONF_NAME),
-            },
+            options=_screen_options(self.user_input[CONF_SCREEN_TYPE_NAME], user_input),
         )
 
         if CONF_NAME in user_input:
@@ -246,6 +379,78 @@ class XdisplayOptionsFlowHandler(OptionsFlow):
 
         return self.async_create_entry(title="", data={})
 
+    async def async_step_add_screens_bulk(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Add several screens at once from a YAML list."""
+        errors: dict[str, Any] = {}
+        data_schema = vol.Schema(
+            {vol.Required(CONF_SCREENS): selector.ObjectSelector()}
+        )
+
+        if user_input is None:
+            return self.async_show_form(
+                step_id="add_screens_bulk",
+                data_schema=data_schema,
+                errors=errors,
+            )
+
+        screens: list[dict[str, Any]] = []
+        try:
+            screens = BULK_SCREENS_SCHEMA(user_input[CONF_SCREENS])
+        except vol.Invalid as err:
+            _LOGGER.warning("Invalid screens: %s", err)
+            errors["base"] = "invalid_screens"
+        else:
+            if len(self.config_entry.data[CONF_SCREENS]) + len(screens) > (
+                MAX_SCREEN_COUNT
+            ):
+                errors["base"] = "too_many_screens"
+            for index, screen in enumerate(screens):
+                if error := self._validate_screen_sources(
+                    screen[CONF_SCREEN_TYPE_NAME], screen
+                ):
+                    _LOGGER.warning(
+                        "Invalid linked entity for screen %s: %s", index, error
+                    )
+                    errors["base"] = error
+
+        if errors:
+            return self.async_show_form(
+                step_id="add_screens_bulk",
+                data_schema=data_schema,
+                errors=errors,
+            )
+
+        _LOGGER.info(
+            "Adding %s screens to %s",
+            len(screens),
+            self.config_entry.data[CONF_PREFIX_TOPIC],
+        )
+
+        first_screen_id = len(self.config_entry.data[CONF_SCREENS])
+        await xdisplay_mqtt_add_screens(
+            self.hass,
+            self.config_entry.data[CONF_PREFIX_TOPIC],
+            [
+                (
+                    first_screen_id + index,
+                    XDisplayScreenTypes[screen[CONF_SCREEN_TYPE_NAME]],
+                    screen.get(CONF_NAME),
+                )
+                for index, screen in enumerate(screens)
+            ],
+        )
+
+        self.add_screens_config_data(
+            [
+                _screen_options(screen[CONF_SCREEN_TYPE_NAME], screen)
+                for screen in screens
+            ]
+        )
+
+        return self.async_create_entry(title="", data={})
+
     async def async_step_update_screen(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -344,6 +549,108 @@ class XdisplayOptionsFlowHandler(OptionsFlow):
 
         return self.async_create_entry(title="", data={})
 
+    async def async_step_topic_policies(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Override the QoS and retain of topics, by screen type or topic."""
+        errors: dict[str, Any] = {}
+        data_schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_TOPIC_POLICIES,
+                    default=self.config_entry.data.get(CONF_TOPIC_POLICIES, {}),
+                ): selector.ObjectSelector()
+            }
+        )
+
+        if user_input is None:
+            return self.async_show_form(
+                step_id="topic_policies",
+                data_schema=data_schema,
+                errors=errors,
+            )
+
+        try:
+            topic_policies = TOPIC_POLICIES_SCHEMA(
+                user_input.get(CONF_TOPIC_POLICIES) or {}
+            )
+        except vol.Invalid as err:
+            _LOGGER.warning("Invalid topic policies: %s", err)
+            errors["base"] = "invalid_topic_policies"
+            return self.async_show_form(
+                step_id="topic_policies",
+                data_schema=data_schema,
+                errors=errors,
+            )
+
+        entry_data = self.config_entry.data.copy()
+        entry_data[CONF_TOPIC_POLICIES] = topic_policies
+        self.hass.config_entries.async_update_entry(self.config_entry, data=entry_data)
+        self.hass.async_create_task(
+            self.hass.config_entries.async_reload(self.config_entry.entry_id)
+        )
+
+        return self.async_create_entry(title="", data={})
+
+    def _validate_screen_sources(
+        self, screen_type: str, screen_input: dict[str, Any]
+    ) -> str | None:
+        """Return the error of the entities or template of a screen, if any."""
+        if screen_template := screen_input.get(CONF_SCREEN_TEMPLATE):
+            return self._validate_screen_template(screen_type, screen_template)
+        area_id = screen_input.get(CONF_SCREEN_AREA)
+        if area_id and ar.async_get(self.hass).async_get_area(area_id) is None:
+            return "area_not_found"
+        domains = XDISPLAY_SCREEN_TYPE_DOMAINS[screen_type]
+        entity_ids = linked_entity_ids(screen_input)
+        # Home screens can follow an area without other entities
+        if not domains or (area_id and not entity_ids):
+            return None
+        if not entity_ids or any(
+            self.hass.states.get(entity_id) is None for entity_id in entity_ids
+        ):
+            return "entity_not_found"
+        # Syncs of single entity screen types expect the entity id as a string
+        if len(entity_ids) > XDISPLAY_SCREEN_TYPE_MULTIPLE_ENTITIES.get(
+            screen_type, 1
+        ) or (
+            screen_type not in XDISPLAY_SCREEN_TYPE_MULTIPLE_ENTITIES
+            and not isinstance(screen_input.get(CONF_SCREEN_LINKED_ENTITY), str)
+        ):
+            return "too_many_entities"
+        return (
+            "entity_wrong_domain"
+            if any(entity_id.split(".")[0] not in domains for entity_id in entity_ids)
+            else None
+        )
+
+    def _validate_screen_template(
+        self, screen_type: str, screen_template: str
+    ) -> str | None:
+        """Return the error of the template of a screen, if any."""
+        if screen_type not in XDISPLAY_SENSOR_SCREEN_TYPES:
+            return "invalid_template"
+        try:
+            Template(screen_template, self.hass).ensure_valid()
+        except TemplateError:
+            return "invalid_template"
+        return None
+
+    @callback
+    def add_screens_config_data(self, screens: list[dict[str, Any]]) -> None:
+        """Add screens in ConfigEntry, with a single update and reload."""
+        entry_data = self.config_entry.data.copy()
+        entry_data[CONF_SCREENS] = [
+            *copy.deepcopy(list(self.config_entry.data[CONF_SCREENS])),
+            *screens,
+        ]
+        _LOGGER.debug("Adding %s screens", len(screens))
+
+        self.hass.config_entries.async_update_entry(self.config_entry, data=entry_data)
+        self.hass.async_create_task(
+            self.hass.config_entries.async_reload(self.config_entry.entry_id)
+        )
+
     @callback
     def update_screen_config_data(
         self,
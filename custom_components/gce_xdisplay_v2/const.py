@@ -2,6 +2,10 @@
 
 from enum import Enum
 
+from homeassistant.components.alarm_control_panel.const import (
+    DOMAIN as ALARM_CONTROL_PANEL_DOMAIN,
+)
+from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
 from homeassistant.components.climate.const import DOMAIN as CLIMATE_DOMAIN
 from homeassistant.components.cover.const import DOMAIN as COVER_DOMAIN
 from homeassistant.components.light.const import DOMAIN as LIGHT_DOMAIN
@@ -12,12 +16,41 @@ from homeassistant.components.weather.const import DOMAIN as WEATHER_DOMAIN
 
 DOMAIN = "gce_xdisplay_v2"
 
+DATA_DISPATCHER = f"{DOMAIN}_dispatcher"
+DATA_FORECAST_CACHE = f"{DOMAIN}_forecast_cache"
+DATA_ENERGY_SYNCS = f"{DOMAIN}_energy_syncs"
+
 CONF_PREFIX_TOPIC = "topic_prefix"
 CONF_SCREENS = "screens"
 CONF_SCREEN_TYPE_NAME = "screen_type_name"
 CONF_SCREEN_TYPE_ID = "screen_type_id"
 CONF_SCREEN_ID = "screen_id"
 CONF_SCREEN_LINKED_ENTITY = "linked_entity"
+CONF_SCREEN_TEMPLATE = "template"
+CONF_SCREEN_AGGREGATE = "aggregate"
+CONF_SCREEN_PRECISION = "precision"
+CONF_SCREEN_DEADBAND = "deadband"
+CONF_SCREEN_DEADBAND_MODE = "deadband_mode"
+CONF_SCREEN_AREA = "area"
+CONF_TOPIC_POLICIES = "topic_policies"
+
+AGGREGATE_MEAN = "mean"
+AGGREGATE_MIN = "min"
+AGGREGATE_MAX = "max"
+
+DEADBAND_MODE_ABSOLUTE = "absolute"
+DEADBAND_MODE_RELATIVE = "relative"
+
+# What was done with a message, in the trace
+TRACE_RECEIVED = "received"
+TRACE_PUBLISHED = "published"
+TRACE_UNCHANGED = "unchanged"
+TRACE_HELD = "held"
+TRACE_BATCHED = "batched"
+TRACE_BUFFERED = "buffered"
+TRACE_FAILED = "failed"
+TRACE_OUTDATED = "outdated"
+TRACE_DEADBAND = "deadband"
 
 MAX_SCREEN_COUNT = 16
 
@@ -46,7 +79,12 @@ class XDisplayScreenTypes(Enum):
 XDISPLAY_SCREEN_TYPE_DOMAINS = {
     XDisplayScreenTypes.THERMOSTAT.name: [CLIMATE_DOMAIN],
     XDisplayScreenTypes.BUTTON.name: [SWITCH_DOMAIN, LIGHT_DOMAIN],
-    XDisplayScreenTypes.HOME.name: [],
+    XDisplayScreenTypes.HOME.name: [
+        LIGHT_DOMAIN,
+        COVER_DOMAIN,
+        BINARY_SENSOR_DOMAIN,
+        ALARM_CONTROL_PANEL_DOMAIN,
+    ],
     XDisplayScreenTypes.COVER.name: [COVER_DOMAIN],
     XDisplayScreenTypes.NIGHT_LIGHT.name: [],
     XDisplayScreenTypes.TEMPERATURE.name: [SENSOR_DOMAIN],
@@ -55,15 +93,31 @@ XDISPLAY_SCREEN_TYPE_DOMAINS = {
     XDisplayScreenTypes.FOUR_BUTTONS.name: [SWITCH_DOMAIN, LIGHT_DOMAIN],
     XDisplayScreenTypes.SLIDER.name: [LIGHT_DOMAIN],
     XDisplayScreenTypes.PLAYER.name: [MEDIA_PLAYER_DOMAIN],
-    XDisplayScreenTypes.KEYBOARD.name: [],
+    XDisplayScreenTypes.KEYBOARD.name: [ALARM_CONTROL_PANEL_DOMAIN],
     XDisplayScreenTypes.XPOOL.name: [],
     XDisplayScreenTypes.WEATHER.name: [WEATHER_DOMAIN],
-    XDisplayScreenTypes.CONSUMPTION.name: [],
+    XDisplayScreenTypes.CONSUMPTION.name: [SENSOR_DOMAIN],
     XDisplayScreenTypes.ENERGY.name: [],
 }
 
+# Screen types linked to several entities, with the maximum count
+XDISPLAY_SCREEN_TYPE_MULTIPLE_ENTITIES = {
+    XDisplayScreenTypes.FOUR_BUTTONS.name: 4,
+    XDisplayScreenTypes.TEMPERATURE.name: 64,
+    XDisplayScreenTypes.HUMIDITY.name: 64,
+    XDisplayScreenTypes.LUMINOSITY.name: 64,
+    XDisplayScreenTypes.HOME.name: 512,
+}
+
 XDISPLAY_SCREEN_TYPE_DEVICE_CLASSES = {
     XDisplayScreenTypes.TEMPERATURE.name: ["temperature"],
     XDisplayScreenTypes.HUMIDITY.name: ["humidity"],
     XDisplayScreenTypes.LUMINOSITY.name: ["illuminance"],
+    XDisplayScreenTypes.CONSUMPTION.name: ["power"],
 }
+
+XDISPLAY_SENSOR_SCREEN_TYPES = [
+    XDisplayScreenTypes.TEMPERATURE.name,
+    XDisplayScreenTypes.HUMIDITY.name,
+    XDisplayScreenTypes.LUMINOSITY.name,
+]
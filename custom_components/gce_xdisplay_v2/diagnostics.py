@@ -0,0 +1,25 @@
+"""Diagnostics support for GCE X-Display V2 integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from .const import CONF_PREFIX_TOPIC, CONF_SCREENS, DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data = hass.data[DOMAIN][config_entry.entry_id]
+    return {
+        CONF_PREFIX_TOPIC: config_entry.data[CONF_PREFIX_TOPIC],
+        CONF_SCREENS: config_entry.data[CONF_SCREENS],
+        "commands": data.commands.as_dict(),
+        "pacing": data.mqtt.pacing.as_dict(),
+        "trace": data.mqtt.trace_as_list(),
+    }
@@ -0,0 +1,227 @@
+"""Dispatch of X-Display commands to Home Assistant services."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import statistics
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import Context, callback
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import DATA_DISPATCHER, DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+COMMAND_TIMEOUT = 10
+LATENCY_SAMPLES = 100
+# Delay after which a command without resulting state change is forgotten
+TRACE_TIMEOUT = 60
+
+
+def _latency_summary(latencies: deque[float]) -> dict[str, Any]:
+    """Return the median and max of latencies, in ms."""
+    if not latencies:
+        return {"latency_median": None, "latency_max": None}
+    return {
+        "latency_median": round(statistics.median(latencies) * 1000, 1),
+        "latency_max": round(max(latencies) * 1000, 1),
+    }
+
+
+@dataclass
+class XDisplayCommand:
+    """Service call requested from a X-Display."""
+
+    domain: str
+    service: str
+    data: dict[str, Any]
+    supersede: str | None
+    trace: XDisplayCommandTrace
+    context: Context = field(default_factory=Context)
+    queued: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class XDisplayCommandTrace:
+    """Origin of a command, to measure the round trip to the X-Display."""
+
+    screen_type: str
+    integration: str
+    received: float
+    # Counters of the X-Display the command comes from
+    stats: XDisplayCommandStats
+
+
+@dataclass
+class XDisplayCommandStats:
+    """Counters of the commands dispatched for a X-Display."""
+
+    calls: int = 0
+    superseded: int = 0
+    timeouts: int = 0
+    errors: int = 0
+    latencies: deque[float] = field(
+        default_factory=lambda: deque(maxlen=LATENCY_SAMPLES)
+    )
+    # From the X-Display command to the resulting state published back
+    round_trips: dict[str, dict[str, deque[float]]] = field(
+        default_factory=lambda: {"screen_type": {}, "integration": {}}
+    )
+
+    def add_round_trip(self, trace: XDisplayCommandTrace, latency: float) -> None:
+        """Add the round trip latency of a command."""
+        for group, key in (
+            ("screen_type", trace.screen_type),
+            ("integration", trace.integration),
+        ):
+            self.round_trips[group].setdefault(
+                key, deque(maxlen=LATENCY_SAMPLES)
+            ).append(latency)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters, with latency of last commands in ms."""
+        return {
+            "calls": self.calls,
+            "superseded": self.superseded,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            **_latency_summary(self.latencies),
+            "round_trip": {
+                group: {
+                    key: {"count": len(latencies), **_latency_summary(latencies)}
+                    for key, latencies in round_trips.items()
+                }
+                for group, round_trips in self.round_trips.items()
+            },
+        }
+
+
+class XDisplayCommandDispatcher:
+    """
+    Run X-Display commands outside of the MQTT message handling.
+
+    Each entity has its own queue, run in order by a worker while other
+    entities run in parallel. A pending command is replaced by a newer one
+    with the same `supersede` key, e.g. several presses on an on/off button.
+    The dispatcher is shared, commands are counted in the stats of the
+    X-Display they come from.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the dispatcher."""
+        self.hass = hass
+        self._queues: dict[str, deque[XDisplayCommand]] = {}
+        self._traces: dict[str, XDisplayCommandTrace] = {}
+
+    @callback
+    def async_call(
+        self,
+        domain: str,
+        service: str,
+        data: dict[str, Any],
+        *,
+        trace: XDisplayCommandTrace,
+        supersede: str | None = None,
+    ) -> None:
+        """Queue a service call, traced until its state change is published."""
+        key = str(data.get(ATTR_ENTITY_ID, domain))
+        command = XDisplayCommand(domain, service, data, supersede, trace)
+        trace.stats.calls += 1
+        self._traces[command.context.id] = trace
+        self._expire_traces()
+
+        if (queue := self._queues.get(key)) is None:
+            queue = self._queues[key] = deque([command])
+            self.hass.async_create_background_task(
+                self._async_run(key, queue), f"{DOMAIN} commands {key}"
+            )
+            return
+
+        if supersede is not None:
+            for pending in queue:
+                if pending.supersede == supersede:
+                    _LOGGER.debug(
+                        "%s.%s on %s superseded", pending.domain, pending.service, key
+                    )
+                    queue.remove(pending)
+                    pending.trace.stats.superseded += 1
+                    break
+        queue.append(command)
+
+    async def _async_run(self, key: str, queue: deque[XDisplayCommand]) -> None:
+        """Run the commands of an entity, in order."""
+        try:
+            while queue:
+                await self._async_execute(queue.popleft())
+        finally:
+            del self._queues[key]
+
+    async def _async_execute(self, command: XDisplayCommand) -> None:
+        """Run a command, with timeout."""
+        try:
+            async with asyncio.timeout(COMMAND_TIMEOUT):
+                await self.hass.services.async_call(
+                    command.domain,
+                    command.service,
+                    command.data,
+                    blocking=True,
+                    context=command.context,
+                )
+        except TimeoutError:
+            command.trace.stats.timeouts += 1
+            # Service data is not logged, it may hold an alarm code
+            _LOGGER.warning(
+                "%s.%s on %s timed out after %ss",
+                command.domain,
+                command.service,
+                command.data.get(ATTR_ENTITY_ID),
+                COMMAND_TIMEOUT,
+            )
+        except (HomeAssistantError, vol.Invalid) as err:
+            command.trace.stats.errors += 1
+            _LOGGER.warning("%s.%s failed: %s", command.domain, command.service, err)
+        except Exception:
+            # Not raised, it would end the worker and drop the queued commands
+            command.trace.stats.errors += 1
+            _LOGGER.exception(
+                "Unexpected error in %s.%s on %s",
+                command.domain,
+                command.service,
+                command.data.get(ATTR_ENTITY_ID),
+            )
+        else:
+            command.trace.stats.latencies.append(time.monotonic() - command.queued)
+
+    @callback
+    def async_close_trace(self, context_id: str) -> None:
+        """Record the round trip of the command which caused a state change."""
+        if (trace := self._traces.pop(context_id, None)) is None:
+            return
+        trace.stats.add_round_trip(trace, time.monotonic() - trace.received)
+
+    def _expire_traces(self) -> None:
+        """Forget the commands which caused no state change."""
+        limit = time.monotonic() - TRACE_TIMEOUT
+        while self._traces:
+            context_id, trace = next(iter(self._traces.items()))
+            if trace.received >= limit:
+                return
+            del self._traces[context_id]
+
+
+@callback
+def async_get_dispatcher(hass: HomeAssistant) -> XDisplayCommandDispatcher:
+    """Get the command dispatcher shared by all X-Display."""
+    if (dispatcher := hass.data.get(DATA_DISPATCHER)) is None:
+        dispatcher = hass.data[DATA_DISPATCHER] = XDisplayCommandDispatcher(hass)
+    return dispatcher
@@ -2,9 +2,6 @@
 
 import logging
 
-from homeassistant.components.mqtt.client import (
-    async_subscribe,
-)
 from homeassistant.components.mqtt.models import (
     ReceiveMessage,
 )
@@ -19,6 +16,7 @@ from homeassistant.util import slugify
 
 from .const import CONF_PREFIX_TOPIC, DOMAIN
 from .definitions import XdisplayEntityDescription
+from .mqtt import XDisplayMqttClient
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,6 +35,7 @@ class XdisplayEntity(Entity):
 
         self._mqtt_topic = f"{config_entry.data[CONF_PREFIX_TOPIC]}/{description.key}"
         self._mqtt_value = None
+        self._entry_id = config_entry.entry_id
 
         slug = slugify(description.key.replace("/", "_"))
         self._attr_unique_id = f"{config_entry.entry_id}-{slug}"
@@ -50,6 +49,11 @@ class XdisplayEntity(Entity):
             serial_number=config_entry.data[CONF_DEVICE_ID],
         )
 
+    @property
+    def _mqtt(self) -> XDisplayMqttClient:
+        """Return the MQTT client of the X-Display."""
+        return self.hass.data[DOMAIN][self._entry_id].mqtt
+
     async def async_added_to_hass(self) -> None:
         """Subscribe to MQTT events."""
 
@@ -66,7 +70,11 @@ class XdisplayEntity(Entity):
             self.async_write_ha_state()
 
         try:
-            await async_subscribe(self.hass, self._mqtt_topic, message_received, 1)
+            self.async_on_remove(
+                await self._mqtt.async_subscribe(
+                    self._mqtt_topic, message_received, qos=1
+                )
+            )
             _LOGGER.debug("Subscribed to %s", self._mqtt_topic)
         except HomeAssistantError:
             async_create_issue(
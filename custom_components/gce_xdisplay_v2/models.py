@@ -0,0 +1,21 @@
+"""Runtime data for GCE X-Display V2 integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from .dispatcher import XDisplayCommandStats
+
+if TYPE_CHECKING:
+    from .mqtt import XDisplayMqttClient
+    from .sync import XDisplaySync
+
+
+@dataclass
+class XDisplayData:
+    """Runtime data of a X-Display config entry."""
+
+    mqtt: XDisplayMqttClient
+    syncs: list[XDisplaySync] = field(default_factory=list)
+    commands: XDisplayCommandStats = field(default_factory=XDisplayCommandStats)
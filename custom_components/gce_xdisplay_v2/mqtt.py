@@ -1,9 +1,419 @@
 """Tools for GCE XDisplay V2 integration."""
 
-from homeassistant.components.mqtt.client import async_publish
-from homeassistant.core import HomeAssistant
+from __future__ import annotations
 
-from custom_components.gce_xdisplay_v2.const import XDisplayScreenTypes
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import REDACTED
+from homeassistant.components.mqtt import (
+    async_subscribe_connection_status,
+    is_connected,
+)
+from homeassistant.components.mqtt.client import async_publish, async_subscribe
+from homeassistant.core import (
+    HassJobType,
+    HomeAssistant,
+    callback,
+    get_hassjob_callable_job_type,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from custom_components.gce_xdisplay_v2.capture import XDisplayCapture
+from custom_components.gce_xdisplay_v2.const import (
+    CONF_PREFIX_TOPIC,
+    DOMAIN,
+    TRACE_BATCHED,
+    TRACE_BUFFERED,
+    TRACE_FAILED,
+    TRACE_HELD,
+    TRACE_PUBLISHED,
+    TRACE_RECEIVED,
+    TRACE_UNCHANGED,
+)
+from custom_components.gce_xdisplay_v2.pacing import XDisplayPacing
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Coroutine, Iterator
+    from pathlib import Path
+
+    from homeassistant.components.mqtt.models import (
+        PublishPayloadType,
+        ReceiveMessage,
+    )
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import CALLBACK_TYPE
+
+    from custom_components.gce_xdisplay_v2.const import XDisplayScreenTypes
+
+_LOGGER = logging.getLogger(__name__)
+
+DIRECTION_IN = "i"
+DIRECTION_OUT = "o"
+
+SCREEN_OFF_PAYLOAD = "1"
+
+# Recent messages kept for diagnostics
+TRACE_SIZE = 200
+
+OFFLINE_BUFFER_SIZE = 256
+# Messages published together then pause, when flushing many messages
+FLUSH_BATCH = 32
+FLUSH_PACE = 0.05
+
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 30
+
+# Set while publishing only the payloads differing from the stored ones
+_diff_only: ContextVar[bool] = ContextVar("diff_only", default=False)
+
+
+class _XDisplayBatch:
+    """Messages collected to be published as one paced batch."""
+
+    def __init__(self) -> None:
+        """Initialize the batch."""
+        self.messages: dict[str, tuple[PublishPayloadType, int, bool]] = {}
+        # Publishes scheduled from the batch but run after it are not collected
+        self.closed = False
+
+
+# Set while collecting the messages of a batch
+_batch: ContextVar[_XDisplayBatch | None] = ContextVar("batch", default=None)
+
+
+class XDisplayMqttClient:
+    """MQTT traffic between Home Assistant and a X-Display."""
+
+    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+        """Initialize the client."""
+        self.hass = hass
+        self.config_entry = config_entry
+        self.capture: XDisplayCapture | None = None
+        # Inbound topics whose payloads are secret (codes), never recorded
+        self.redacted_topics: set[str] = set()
+        # Topics held under load, from their policy
+        self.telemetry_topics: set[str] = set()
+        # Recent messages with what was done with them, formatted only when
+        # exported
+        self.trace: deque[
+            tuple[float, str, str, PublishPayloadType, str, float | None]
+        ] = deque(maxlen=TRACE_SIZE)
+
+        # Last payload published per topic, persisted across restarts
+        self.published: dict[str, str] = {}
+        self._store = Store[dict[str, str]](
+            hass, STORAGE_VERSION, f"{DOMAIN}.{config_entry.entry_id}"
+        )
+
+        # Latest message per topic, held while the screen is off (deferrable
+        # screens) or Home Assistant is under load (telemetry topics)
+        self.screen_off = False
+        self.pacing = XDisplayPacing(hass)
+        self._held: dict[str, tuple[PublishPayloadType, int, bool]] = {}
+
+        # Latest message per topic, held while the broker is disconnected
+        self._offline: dict[str, tuple[PublishPayloadType, int, bool]] = {}
+
+    async def async_load(self) -> None:
+        """Load the payloads published before restart."""
+        self.published = await self._store.async_load() or {}
+
+    async def async_remove(self) -> None:
+        """Remove the stored payloads."""
+        await self._store.async_remove()
+
+    async def async_track_screen_off(self) -> None:
+        """Follow the screen state, until the config entry is unloaded."""
+
+        @callback
+        def screen_off_received(msg: ReceiveMessage) -> None:
+            """Hold deferrable messages while the screen is off."""
+            screen_off = msg.payload == SCREEN_OFF_PAYLOAD
+            if screen_off == self.screen_off:
+                return
+            self.screen_off = screen_off
+            self._async_release_held()
+
+        self.config_entry.async_on_unload(
+            await self.async_subscribe(
+                f"{self.config_entry.data[CONF_PREFIX_TOPIC]}/screenoff",
+                screen_off_received,
+                qos=1,
+            )
+        )
+
+    @callback
+    def async_track_pacing(self) -> None:
+        """Sample the load, until the config entry is unloaded."""
+        self.config_entry.async_on_unload(self.pacing.async_start())
+        self.config_entry.async_on_unload(
+            self.pacing.async_add_listener(self._async_release_held)
+        )
+
+    @callback
+    def _async_release_held(self) -> None:
+        """Publish the held messages, once the screen is on and load is low."""
+        if self._held and not self.screen_off and not self.pacing.defer:
+            self.config_entry.async_create_task(
+                self.hass, self._async_publish_held(), "publish held messages"
+            )
+
+    @callback
+    def async_track_connection(self) -> None:
+        """Follow the broker connection, until the config entry is unloaded."""
+
+        @callback
+        def connection_status_changed(connected: bool) -> None:  # noqa: FBT001
+            """Publish buffered messages on reconnect."""
+            if connected and self._offline:
+                self.config_entry.async_create_task(
+                    self.hass, self._async_publish_offline(), "publish buffered"
+                )
+
+        self.config_entry.async_on_unload(
+            async_subscribe_connection_status(self.hass, connection_status_changed)
+        )
+
+    def _buffer_offline(
+        self, topic: str, payload: PublishPayloadType, *, qos: int, retain: bool
+    ) -> None:
+        """Keep the latest message of a topic until the broker is reconnected."""
+        self._offline.pop(topic, None)
+        if len(self._offline) >= OFFLINE_BUFFER_SIZE:
+            dropped = next(iter(self._offline))
+            del self._offline[dropped]
+            _LOGGER.debug("Offline buffer full, dropping %s", dropped)
+        self._offline[topic] = (payload, qos, retain)
+
+    async def _async_publish_offline(self) -> None:
+        """Publish messages buffered while disconnected, paced by batches."""
+        _LOGGER.debug("Broker reconnected, publishing %s messages", len(self._offline))
+        await self._async_publish_paced(self._offline)
+
+    async def _async_publish_paced(
+        self, messages: dict[str, tuple[PublishPayloadType, int, bool]]
+    ) -> None:
+        """Publish and remove messages, by batches with a pause in between."""
+        while messages and self.connected:
+            batch = list(messages.items())[:FLUSH_BATCH]
+            for topic, _ in batch:
+                del messages[topic]
+            await asyncio.gather(
+                *(
+                    self.async_publish(topic, payload, qos=qos, retain=retain)
+                    for topic, (payload, qos, retain) in batch
+                )
+            )
+            await asyncio.sleep(FLUSH_PACE)
+        if messages is self._offline:
+            return
+        # Left when disconnected, published on reconnect
+        for topic, (payload, qos, retain) in messages.items():
+            self._buffer_offline(topic, payload, qos=qos, retain=retain)
+        messages.clear()
+
+    async def _async_publish_held(self) -> None:
+        """Publish the held messages, as one batch."""
+        held, self._held = self._held, {}
+        _LOGGER.debug("Publishing %s held messages", len(held))
+        await asyncio.gather(
+            *(
+                self.async_publish(topic, payload, qos=qos, retain=retain)
+                for topic, (payload, qos, retain) in held.items()
+            )
+        )
+
+    @callback
+    def trace_message(
+        self,
+        direction: str,
+        topic: str,
+        payload: PublishPayloadType,
+        decision: str,
+        duration: float | None = None,
+    ) -> None:
+        """Add a message to the trace, with what was done with it."""
+        self.trace.append((time.time(), direction, topic, payload, decision, duration))
+
+    @callback
+    def trace_dropped(
+        self, topic: str, payload: PublishPayloadType, reason: str
+    ) -> None:
+        """Add a message dropped before publish to the trace."""
+        self.trace_message(DIRECTION_OUT, topic, payload, reason)
+
+    def trace_as_list(self) -> list[dict[str, Any]]:
+        """Return the trace, oldest message first, durations in ms."""
+        return [
+            {
+                "time": dt_util.utc_from_timestamp(timestamp).isoformat(),
+                "direction": direction,
+                "topic": topic,
+                "payload": payload if payload is None else str(payload),
+                "decision": decision,
+                "duration": None if duration is None else round(duration * 1000, 1),
+            }
+            for timestamp, direction, topic, payload, decision, duration in self.trace
+        ]
+
+    @contextmanager
+    def diff_only(self) -> Iterator[None]:
+        """Skip publishing payloads already shown by the X-Display."""
+        token = _diff_only.set(True)
+        try:
+            yield
+        finally:
+            _diff_only.reset(token)
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """Collect the messages published, then publish them paced."""
+        batch = _XDisplayBatch()
+        token = _batch.set(batch)
+        try:
+            yield
+        finally:
+            _batch.reset(token)
+            batch.closed = True
+        _LOGGER.debug("Publishing batch of %s messages", len(batch.messages))
+        await self._async_publish_paced(batch.messages)
+
+    @callback
+    def async_start_capture(self, path: Path) -> None:
+        """Start capturing the traffic, replacing the running capture."""
+        # Detached at once, the stop task would otherwise stop the new one
+        if (running := self.capture) is not None:
+            self.capture = None
+            self.hass.async_create_task(running.async_stop())
+        self.capture = XDisplayCapture(self.hass, self.config_entry, path)
+        self.capture.async_start()
+
+    async def async_stop_capture(self) -> None:
+        """Stop the running capture."""
+        if (capture := self.capture) is None:
+            return
+        self.capture = None
+        await capture.async_stop()
+
+    @property
+    def connected(self) -> bool:
+        """Return True if the broker is connected."""
+        return is_connected(self.hass)
+
+    async def async_broker_publish(
+        self, topic: str, payload: PublishPayloadType, *, qos: int, retain: bool
+    ) -> None:
+        """Send a message to the broker, as decided by `async_publish`."""
+        await async_publish(self.hass, topic, payload, qos, retain)
+
+    async def async_publish(
+        self,
+        topic: str,
+        payload: PublishPayloadType,
+        *,
+        qos: int = 0,
+        retain: bool = False,
+        deferrable: bool = False,
+    ) -> None:
+        """
+        Publish a message to the X-Display.
+
+        Deferrable messages are held while the screen is off, and messages of
+        telemetry topics while the pacing defers them, only the latest per
+        topic, and published when both are over. Interactive feedback is never
+        held by the pacing.
+        """
+        stored_payload = "" if payload is None else str(payload)
+        if _diff_only.get() and self.published.get(topic) == stored_payload:
+            self.trace_message(DIRECTION_OUT, topic, payload, TRACE_UNCHANGED)
+            return
+        if (deferrable and self.screen_off) or (
+            topic in self.telemetry_topics and self.pacing.defer
+        ):
+            self.trace_message(DIRECTION_OUT, topic, payload, TRACE_HELD)
+            self._held[topic] = (payload, qos, retain)
+            return
+        if (batch := _batch.get()) is not None and not batch.closed:
+            self.trace_message(DIRECTION_OUT, topic, payload, TRACE_BATCHED)
+            batch.messages[topic] = (payload, qos, retain)
+            return
+        if not self.connected:
+            self.trace_message(DIRECTION_OUT, topic, payload, TRACE_BUFFERED)
+            self._buffer_offline(topic, payload, qos=qos, retain=retain)
+            return
+        # A buffered message still to flush would be older than this one
+        self._offline.pop(topic, None)
+        if self.capture is not None:
+            self.capture.record(DIRECTION_OUT, topic, payload)
+        start = time.monotonic()
+        try:
+            await self.async_broker_publish(topic, payload, qos=qos, retain=retain)
+        except HomeAssistantError as err:
+            _LOGGER.debug("Cannot publish to %s, buffering it: %s", topic, err)
+            self.trace_message(
+                DIRECTION_OUT, topic, payload, TRACE_FAILED, time.monotonic() - start
+            )
+            self._buffer_offline(topic, payload, qos=qos, retain=retain)
+            return
+        duration = time.monotonic() - start
+        self.pacing.record_publish(duration)
+        self.trace_message(DIRECTION_OUT, topic, payload, TRACE_PUBLISHED, duration)
+        if self.published.get(topic) != stored_payload:
+            self.published[topic] = stored_payload
+            self._store.async_delay_save(lambda: self.published, STORAGE_SAVE_DELAY)
+
+    async def async_subscribe(
+        self,
+        topic: str,
+        msg_callback: Callable[[ReceiveMessage], Coroutine[Any, Any, None] | None],
+        *,
+        qos: int = 0,
+    ) -> CALLBACK_TYPE:
+        """Subscribe to a X-Display topic, return the unsubscribe callback."""
+        if get_hassjob_callable_job_type(msg_callback) is HassJobType.Callback:
+
+            @callback
+            def message_received(msg: ReceiveMessage) -> None:
+                """Handle a message from the X-Display."""
+                payload = REDACTED if msg.topic in self.redacted_topics else msg.payload
+                if self.capture is not None:
+                    self.capture.record(DIRECTION_IN, msg.topic, payload)
+                start = time.monotonic()
+                msg_callback(msg)
+                self.trace_message(
+                    DIRECTION_IN,
+                    msg.topic,
+                    payload,
+                    TRACE_RECEIVED,
+                    time.monotonic() - start,
+                )
+
+        else:
+
+            async def message_received(msg: ReceiveMessage) -> None:
+                """Handle a message from the X-Display."""
+                payload = REDACTED if msg.topic in self.redacted_topics else msg.payload
+                if self.capture is not None:
+                    self.capture.record(DIRECTION_IN, msg.topic, payload)
+                start = time.monotonic()
+                await msg_callback(msg)
+                self.trace_message(
+                    DIRECTION_IN,
+                    msg.topic,
+                    payload,
+                    TRACE_RECEIVED,
+                    time.monotonic() - start,
+                )
+
+        return await async_subscribe(self.hass, topic, message_received, qos)
 
 
 async def xdisplay_mqtt_add_screen(
@@ -15,6 +425,32 @@ async def xdisplay_mqtt_add_screen(
     await async_publish(hass, f"{prefix_topic}/new", screen_type.value)
 
 
+async def xdisplay_mqtt_add_screens(
+    hass: HomeAssistant,
+    prefix_topic: str,
+    screens: list[tuple[int, XDisplayScreenTypes, str | None]],
+) -> None:
+    """
+    Create several screens, with their name.
+
+    Commands are published with QoS 1 without waiting for each acknowledgement,
+    then all acknowledgements are awaited. The broker keeps the order of
+    messages from a client, so each screen is created before it is named.
+    """
+    publishes = []
+    for screen_id, screen_type, screen_name in screens:
+        publishes.append(
+            async_publish(hass, f"{prefix_topic}/new", screen_type.value, qos=1)
+        )
+        if screen_name:
+            publishes.append(
+                async_publish(
+                    hass, f"{prefix_topic}/{screen_id}/updateName", screen_name, qos=1
+                )
+            )
+    await asyncio.gather(*publishes)
+
+
 async def xdisplay_mqtt_delete_last_screen(
     hass: HomeAssistant, prefix_topic: str
 ) -> None:
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from homeassistant.components.mqtt.client import async_publish
 from homeassistant.components.number import NumberEntity
 
 from custom_components.gce_xdisplay_v2.entity import XdisplayEntity
@@ -40,10 +39,9 @@ class XdisplayNumber(XdisplayEntity, NumberEntity):
 
     async def async_set_value(self, value: int) -> None:
         """Set new value."""
-        await async_publish(
-            self.hass,
+        await self._mqtt.async_publish(
             self._mqtt_topic,
             value,
-            self.entity_description.qos,
+            qos=self.entity_description.qos,
             retain=True,
         )
@@ -0,0 +1,140 @@
+"""Pacing of the publishes to a X-Display under Home Assistant load."""
+
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_time_interval
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+SAMPLE_INTERVAL = timedelta(seconds=1)
+# Event loop lag and publish completion time above which load is high
+LOOP_LAG_THRESHOLD = 0.1
+PUBLISH_LATENCY_THRESHOLD = 0.5
+# Weight of the last publish in the publish latency average
+PUBLISH_LATENCY_SMOOTHING = 0.2
+# Consecutive samples below half the thresholds to lower the level by one
+RECOVERY_SAMPLES = 10
+
+PACING_LEVEL_MAX = 3
+# Level from which telemetry messages are held
+PACING_DEFER_LEVEL = 2
+
+
+class XDisplayPacing:
+    """
+    Pacing level of a X-Display, from 0 (full speed) to `PACING_LEVEL_MAX`.
+
+    The level is raised by one on each sample with the event loop lag or the
+    publish latency above threshold, and lowered by one after
+    `RECOVERY_SAMPLES` samples well below, to recover gradually. Each level
+    doubles the coalescing windows; from `PACING_DEFER_LEVEL` telemetry
+    messages are held until the load drops.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the pacing."""
+        self.hass = hass
+        self.level = 0
+        self.loop_lag = 0.0
+        self.publish_latency = 0.0
+        self._published = False
+        self._calm_samples = 0
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def factor(self) -> int:
+        """Return the factor applied to the coalescing windows."""
+        return 2**self.level
+
+    @property
+    def defer(self) -> bool:
+        """Return True if telemetry messages must be held."""
+        return self.level >= PACING_DEFER_LEVEL
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Start sampling the load, return the stop callback."""
+        return async_track_time_interval(
+            self.hass, self._async_sample, SAMPLE_INTERVAL, name="X-Display pacing"
+        )
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Listen for level changes, return the remove callback."""
+        self._listeners.append(update_callback)
+        return lambda: self._listeners.remove(update_callback)
+
+    @callback
+    def record_publish(self, latency: float) -> None:
+        """Add the completion time of a publish to the average."""
+        self._published = True
+        self.publish_latency += PUBLISH_LATENCY_SMOOTHING * (
+            latency - self.publish_latency
+        )
+
+    @callback
+    def _async_sample(self, _: datetime) -> None:
+        """Measure the event loop lag, as the delay of a callback run next."""
+        loop = self.hass.loop
+        loop.call_soon(self._async_update, loop.time())
+
+    @callback
+    def _async_update(self, scheduled: float) -> None:
+        """Update the level from the last load samples."""
+        self.loop_lag = self.hass.loop.time() - scheduled
+        if not self._published:
+            # Nothing published (e.g. all held), let the average decay
+            self.record_publish(0)
+        self._published = False
+        if (
+            self.loop_lag > LOOP_LAG_THRESHOLD
+            or self.publish_latency > PUBLISH_LATENCY_THRESHOLD
+        ):
+            self._calm_samples = 0
+            self._async_set_level(min(self.level + 1, PACING_LEVEL_MAX))
+            return
+        if (
+            self.loop_lag > LOOP_LAG_THRESHOLD / 2
+            or self.publish_latency > PUBLISH_LATENCY_THRESHOLD / 2
+        ):
+            self._calm_samples = 0
+            return
+        self._calm_samples += 1
+        if self._calm_samples >= RECOVERY_SAMPLES and self.level:
+            self._calm_samples = 0
+            self._async_set_level(self.level - 1)
+
+    @callback
+    def _async_set_level(self, level: int) -> None:
+        """Set the level and notify the listeners."""
+        if level == self.level:
+            return
+        _LOGGER.debug(
+            "Pacing level %s -> %s (loop lag %.3fs, publish latency %.3fs)",
+            self.level,
+            level,
+            self.loop_lag,
+            self.publish_latency,
+        )
+        self.level = level
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the level, with the last load samples in ms."""
+        return {
+            "level": self.level,
+            "loop_lag": round(self.loop_lag * 1000, 1),
+            "publish_latency": round(self.publish_latency * 1000, 1),
+        }
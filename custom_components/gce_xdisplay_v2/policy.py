@@ -0,0 +1,101 @@
+"""QoS and retain of the topics published to a X-Display."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.helpers import config_validation as cv
+
+from .const import CONF_TOPIC_POLICIES, XDisplayScreenTypes
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+
+ATTR_QOS = "qos"
+ATTR_RETAIN = "retain"
+
+# Topic of the policy table applying to the other topics of the screen type
+TOPIC_DEFAULT = "*"
+
+
+@dataclass(frozen=True)
+class XDisplayTopicPolicy:
+    """QoS and retain of a published topic."""
+
+    qos: int = 0
+    retain: bool = False
+    # Held while the pacing defers messages, interactive feedback never is
+    telemetry: bool = False
+
+
+# State the display cold-boots from: retained and delivered at least once
+STATE = XDisplayTopicPolicy(qos=1, retain=True)
+# Slow-changing values: retained, a lost update is fixed by the next one
+SLOW_TELEMETRY = XDisplayTopicPolicy(qos=0, retain=True, telemetry=True)
+# High-rate values: neither acknowledged nor retained by the broker
+TELEMETRY = XDisplayTopicPolicy(qos=0, retain=False, telemetry=True)
+
+TOPIC_POLICIES: dict[str, dict[str, XDisplayTopicPolicy]] = {
+    XDisplayScreenTypes.BUTTON.name: {TOPIC_DEFAULT: STATE},
+    XDisplayScreenTypes.FOUR_BUTTONS.name: {TOPIC_DEFAULT: STATE},
+    XDisplayScreenTypes.SLIDER.name: {TOPIC_DEFAULT: STATE},
+    XDisplayScreenTypes.COVER.name: {TOPIC_DEFAULT: STATE},
+    XDisplayScreenTypes.THERMOSTAT.name: {
+        TOPIC_DEFAULT: STATE,
+        "ThMeasureCmd": SLOW_TELEMETRY,
+    },
+    XDisplayScreenTypes.PLAYER.name: {TOPIC_DEFAULT: STATE},
+    XDisplayScreenTypes.HOME.name: {TOPIC_DEFAULT: STATE},
+    XDisplayScreenTypes.KEYBOARD.name: {TOPIC_DEFAULT: STATE},
+    XDisplayScreenTypes.TEMPERATURE.name: {TOPIC_DEFAULT: SLOW_TELEMETRY},
+    XDisplayScreenTypes.HUMIDITY.name: {TOPIC_DEFAULT: SLOW_TELEMETRY},
+    XDisplayScreenTypes.LUMINOSITY.name: {TOPIC_DEFAULT: SLOW_TELEMETRY},
+    XDisplayScreenTypes.WEATHER.name: {TOPIC_DEFAULT: SLOW_TELEMETRY},
+    XDisplayScreenTypes.ENERGY.name: {TOPIC_DEFAULT: SLOW_TELEMETRY},
+    XDisplayScreenTypes.CONSUMPTION.name: {TOPIC_DEFAULT: TELEMETRY},
+}
+
+
+def _valid_policy_key(value: Any) -> str:
+    """Validate a `SCREEN_TYPE` or `SCREEN_TYPE/Topic` override key."""
+    key = cv.string(value)
+    screen_type, _, topic = key.partition("/")
+    if screen_type not in XDisplayScreenTypes.__members__ or "/" in topic:
+        raise vol.Invalid(f"Invalid screen type or topic: {key}")  # noqa: EM102, TRY003
+    return key
+
+
+TOPIC_POLICIES_SCHEMA = vol.Schema(
+    {
+        _valid_policy_key: vol.Schema(
+            {
+                vol.Optional(ATTR_QOS): vol.In([0, 1, 2]),
+                vol.Optional(ATTR_RETAIN): cv.boolean,
+            }
+        )
+    }
+)
+
+
+def topic_policy(
+    config_entry: ConfigEntry, screen_type: str, topic: str
+) -> XDisplayTopicPolicy:
+    """
+    Return the policy of a screen topic, `topic` without the screen prefix.
+
+    The policy table is overridden per config entry, by screen type then by
+    topic of a screen type.
+    """
+    policies = TOPIC_POLICIES.get(screen_type, {})
+    policy = policies.get(topic, policies.get(TOPIC_DEFAULT, TELEMETRY))
+    overrides = config_entry.data.get(CONF_TOPIC_POLICIES, {})
+    for key in (screen_type, f"{screen_type}/{topic}"):
+        if (override := overrides.get(key)) is not None:
+            policy = XDisplayTopicPolicy(
+                qos=override.get(ATTR_QOS, policy.qos),
+                retain=override.get(ATTR_RETAIN, policy.retain),
+                telemetry=policy.telemetry,
+            )
+    return policy
@@ -10,13 +10,14 @@ from homeassistant.helpers.device_registry import DeviceInfo
 
 from .const import (
     CONF_PREFIX_TOPIC,
-    CONF_SCREEN_LINKED_ENTITY,
+    CONF_SCREEN_TEMPLATE,
     CONF_SCREEN_TYPE_NAME,
     CONF_SCREENS,
     DOMAIN,
 )
 from .definitions import SENSORS, XdisplaySensorEntityDescription
 from .entity import XdisplayEntity
+from .sync import linked_entity_ids
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -75,11 +76,13 @@ class XDisplaySyncDiagSensorEntity(SensorEntity):
             CONF_NAME, str(screen_config[CONF_SCREEN_TYPE_NAME]).capitalize()
         )
         self._attr_name = f"Screen #{screen_id} {screen_display_name}"
-        self._attr_native_value = self._screen_config[CONF_SCREEN_LINKED_ENTITY]
+        self._attr_native_value = ", ".join(linked_entity_ids(screen_config)) or None
         self._attr_extra_state_attributes = {
             "name": screen_config.get(CONF_NAME, ""),
             "type": screen_config[CONF_SCREEN_TYPE_NAME],
         }
+        if screen_template := screen_config.get(CONF_SCREEN_TEMPLATE):
+            self._attr_extra_state_attributes["template"] = screen_template
         self._attr_unique_id = f"{config_entry.entry_id}-screen-{screen_id}"
         self._attr_device_info = DeviceInfo(
             identifiers={
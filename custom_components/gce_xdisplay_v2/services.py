@@ -0,0 +1,139 @@
+"""Services for GCE X-Display V2 integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from homeassistant.const import CONF_DEVICE_ID
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .const import CONF_SCREEN_TYPE_NAME, DOMAIN, XDisplayScreenTypes
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from .models import XDisplayData
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_START_CAPTURE = "start_capture"
+SERVICE_STOP_CAPTURE = "stop_capture"
+SERVICE_RESYNC = "resync"
+
+ATTR_CONFIG_ENTRY = "config_entry"
+ATTR_DURATION = "duration"
+ATTR_FILENAME = "filename"
+ATTR_SCREEN_TYPE = "screen_type"
+ATTR_SCREEN_ID = "screen_id"
+
+CAPTURE_DIRECTORY = f"{DOMAIN}_captures"
+
+START_CAPTURE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY): cv.string,
+        vol.Optional(ATTR_DURATION): vol.All(cv.time_period, cv.positive_timedelta),
+        vol.Optional(ATTR_FILENAME): vol.All(cv.string, vol.Match(r"^[\w.-]+$")),
+    }
+)
+STOP_CAPTURE_SCHEMA = vol.Schema({vol.Required(ATTR_CONFIG_ENTRY): cv.string})
+RESYNC_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_SCREEN_TYPE): vol.All(
+            cv.ensure_list, [vol.In([screen.name for screen in XDisplayScreenTypes])]
+        ),
+        vol.Optional(ATTR_SCREEN_ID): vol.All(cv.ensure_list, [cv.positive_int]),
+    }
+)
+
+
+def _get_entry_data(hass: HomeAssistant, entry_id: str) -> XDisplayData:
+    """Get runtime data of a config entry targeted by a service call."""
+    if (data := hass.data.get(DOMAIN, {}).get(entry_id)) is None:
+        raise ServiceValidationError(f"X-Display {entry_id} is not loaded")  # noqa: EM102, TRY003
+    return data
+
+
+async def _async_resync(
+    data: XDisplayData, screen_types: list[str] | None, screen_ids: list[int] | None
+) -> None:
+    """Publish again the selected screens of a X-Display, as one paced batch."""
+    syncs = [
+        sync
+        for sync in data.syncs
+        if (
+            screen_types is None
+            or sync.screen_config[CONF_SCREEN_TYPE_NAME] in screen_types
+        )
+        and (screen_ids is None or sync.screen_id in screen_ids)
+    ]
+    if not syncs:
+        return
+    async with data.mqtt.batch():
+        await asyncio.gather(*(sync.async_resync() for sync in syncs))
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register integration services."""
+
+    async def async_start_capture(call: ServiceCall) -> None:
+        """Start capturing X-Display traffic to a file."""
+        data = _get_entry_data(hass, call.data[ATTR_CONFIG_ENTRY])
+        config_entry = data.mqtt.config_entry
+        filename = call.data.get(
+            ATTR_FILENAME,
+            f"{config_entry.data[CONF_DEVICE_ID]}_"
+            f"{dt_util.now().strftime('%Y%m%d%H%M%S')}.jsonl.gz",
+        )
+        data.mqtt.async_start_capture(
+            Path(hass.config.path(CAPTURE_DIRECTORY, filename))
+        )
+
+        if duration := call.data.get(ATTR_DURATION):
+            capture = data.mqtt.capture
+
+            async def async_capture_timeout(_: datetime) -> None:
+                """Stop the capture once duration elapsed."""
+                if data.mqtt.capture is capture:
+                    await data.mqtt.async_stop_capture()
+
+            config_entry.async_on_unload(
+                async_call_later(hass, duration, async_capture_timeout)
+            )
+
+    async def async_stop_capture(call: ServiceCall) -> None:
+        """Stop capturing X-Display traffic."""
+        await _get_entry_data(
+            hass, call.data[ATTR_CONFIG_ENTRY]
+        ).mqtt.async_stop_capture()
+
+    async def async_resync(call: ServiceCall) -> None:
+        """Publish again the screens of X-Display, one display at a time."""
+        if ATTR_CONFIG_ENTRY in call.data:
+            entries = [
+                _get_entry_data(hass, entry_id)
+                for entry_id in call.data[ATTR_CONFIG_ENTRY]
+            ]
+        else:
+            entries = list(hass.data.get(DOMAIN, {}).values())
+        for data in entries:
+            await _async_resync(
+                data, call.data.get(ATTR_SCREEN_TYPE), call.data.get(ATTR_SCREEN_ID)
+            )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_START_CAPTURE, async_start_capture, START_CAPTURE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_STOP_CAPTURE, async_stop_capture, STOP_CAPTURE_SCHEMA
+    )
+    hass.services.async_register(DOMAIN, SERVICE_RESYNC, async_resync, RESYNC_SCHEMA)
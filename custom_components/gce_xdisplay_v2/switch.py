@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from homeassistant.components.mqtt.client import async_publish
 from homeassistant.components.switch import SwitchEntity
 
 from custom_components.gce_xdisplay_v2.entity import XdisplayEntity
@@ -40,20 +39,18 @@ class XdisplaySwitch(XdisplayEntity, SwitchEntity):
 
     async def async_turn_on(self) -> None:
         """Turn the device on."""
-        await async_publish(
-            self.hass,
+        await self._mqtt.async_publish(
             self._mqtt_topic,
             self.entity_description.payload_on,
-            self.entity_description.qos,
-            self.entity_description.retain,
+            qos=self.entity_description.qos,
+            retain=self.entity_description.retain,
         )
 
     async def async_turn_off(self) -> None:
         """Turn the device off."""
-        await async_publish(
-            self.hass,
+        await self._mqtt.async_publish(
             self._mqtt_topic,
             self.entity_description.payload_off,
-            self.entity_description.qos,
-            self.entity_description.retain,
+            qos=self.entity_description.qos,
+            retain=self.entity_description.retain,
         )
@@ -2,24 +2,66 @@
 
 from __future__ import annotations
 
+import logging
+import time
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_STATE_CHANGED, Platform
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_state_change_event
 
 from custom_components.gce_xdisplay_v2.const import (
     CONF_PREFIX_TOPIC,
+    CONF_SCREEN_LINKED_ENTITY,
+    CONF_SCREEN_TYPE_NAME,
+    DOMAIN,
+    TRACE_OUTDATED,
 )
+from custom_components.gce_xdisplay_v2.dispatcher import (
+    XDisplayCommandTrace,
+    async_get_dispatcher,
+)
+from custom_components.gce_xdisplay_v2.policy import XDisplayTopicPolicy, topic_policy
 
 if TYPE_CHECKING:
-    from homeassistant.components.mqtt.models import ReceiveMessage
+    from collections.abc import Callable, Coroutine
+
+    from homeassistant.components.mqtt.models import (
+        PublishPayloadType,
+        ReceiveMessage,
+    )
     from homeassistant.config_entries import ConfigEntry
-    from homeassistant.core import Event, EventStateChangedData, HomeAssistant
+    from homeassistant.core import EventStateChangedData, HomeAssistant
+
+    from custom_components.gce_xdisplay_v2.mqtt import XDisplayMqttClient
 
 PLATFORMS = [Platform.SENSOR, Platform.SWITCH, Platform.NUMBER]
 
+_LOGGER = logging.getLogger(__name__)
+
+# Last update of the entity state being published, set while handling it
+_state_stamp: ContextVar[float | None] = ContextVar("state_stamp", default=None)
+# Reception time of the X-Display command being handled
+_command_received: ContextVar[float | None] = ContextVar(
+    "command_received", default=None
+)
+
+
+def linked_entity_ids(screen_config: dict[str, Any]) -> list[str]:
+    """Return the entities linked to a screen, one or several."""
+    linked_entity = screen_config.get(CONF_SCREEN_LINKED_ENTITY)
+    if not linked_entity:
+        return []
+    if isinstance(linked_entity, str):
+        return [linked_entity]
+    return list(linked_entity)
+
 
 class XDisplaySync(ABC):
     """Sync between entity and X-Display Screen."""
@@ -28,6 +70,8 @@ class XDisplaySync(ABC):
     config_entry: ConfigEntry
     screen_id: int
     screen_config: dict[str, Any]
+    # Messages which can wait for the screen to be turned on
+    deferrable = False
 
     def __init__(
         self,
@@ -45,6 +89,200 @@ class XDisplaySync(ABC):
         self.topic_prefix = (
             self.config_entry.data[CONF_PREFIX_TOPIC] + "/" + str(screen_id)
         )
+        self.mqtt: XDisplayMqttClient = hass.data[DOMAIN][config_entry.entry_id].mqtt
+        # Last update of the entity state published on each topic
+        self._stamps: dict[str, float] = {}
+        self._policies: dict[str, XDisplayTopicPolicy] = {}
+
+    def topic_policy(self, topic: str) -> XDisplayTopicPolicy:
+        """Return the QoS and retain of a topic of the screen."""
+        if (policy := self._policies.get(topic)) is None:
+            policy = self._policies[topic] = topic_policy(
+                self.config_entry,
+                self.screen_config[CONF_SCREEN_TYPE_NAME],
+                topic.removeprefix(f"{self.topic_prefix}/"),
+            )
+            if policy.telemetry:
+                self.mqtt.telemetry_topics.add(topic)
+        return policy
+
+    async def async_publish(
+        self,
+        topic: str,
+        payload: PublishPayloadType,
+        *,
+        qos: int | None = None,
+        retain: bool | None = None,
+        stamp: float | None = None,
+    ) -> bool:
+        """
+        Publish a message to the X-Display, return False if it was dropped.
+
+        The message is dropped if it comes from an entity state older than
+        the one last published on the topic, `stamp` defaulting to the state
+        being handled. QoS and retain default to the policy of the topic.
+        """
+        if stamp is None:
+            stamp = _state_stamp.get()
+        if stamp is not None:
+            if stamp < self._stamps.get(topic, stamp):
+                _LOGGER.debug("Screen #%s: dropping outdated %s", self.screen_id, topic)
+                self.mqtt.trace_dropped(topic, payload, TRACE_OUTDATED)
+                return False
+            self._stamps[topic] = stamp
+        policy = self.topic_policy(topic)
+        await self.mqtt.async_publish(
+            topic,
+            payload,
+            qos=policy.qos if qos is None else qos,
+            retain=policy.retain if retain is None else retain,
+            deferrable=self.deferrable,
+        )
+        return True
+
+    async def async_subscribe(
+        self,
+        topic: str,
+        msg_callback: Callable[[ReceiveMessage], Coroutine[Any, Any, None]],
+    ) -> None:
+        """Subscribe to a X-Display topic until the config entry is unloaded."""
+
+        async def message_received(msg: ReceiveMessage) -> None:
+            """Handle the command with its reception time."""
+            token = _command_received.set(time.monotonic())
+            try:
+                await msg_callback(msg)
+            finally:
+                _command_received.reset(token)
+
+        self.config_entry.async_on_unload(
+            await self.mqtt.async_subscribe(topic, message_received)
+        )
+
+    @callback
+    def async_track_entities(
+        self,
+        entity_ids: list[str],
+        action: Callable[[Event[EventStateChangedData]], Coroutine[Any, Any, None]],
+    ) -> None:
+        """Track entities state changes until the config entry is unloaded."""
+        self.config_entry.async_on_unload(
+            async_track_state_change_event(
+                self.hass, entity_ids, partial(self._async_handle_state, action)
+            )
+        )
+
+    async def _async_handle_state(
+        self,
+        action: Callable[[Event[EventStateChangedData]], Coroutine[Any, Any, None]],
+        event: Event[EventStateChangedData],
+    ) -> None:
+        """Run the action with the update time of the new state."""
+        new_state = event.data["new_state"]
+        token = _state_stamp.set(
+            new_state.last_updated_timestamp if new_state is not None else None
+        )
+        try:
+            await action(event)
+        finally:
+            _state_stamp.reset(token)
+        if new_state is not None:
+            async_get_dispatcher(self.hass).async_close_trace(new_state.context.id)
+
+    @callback
+    def async_call_service(
+        self,
+        domain: str,
+        service: str,
+        service_data: dict[str, Any],
+        *,
+        supersede: str | None = None,
+    ) -> None:
+        """
+        Call a service without waiting for it, in order for each entity.
+
+        A pending call with the same `supersede` key is dropped, for commands
+        only the last of which matters. The call is traced from the reception
+        of the command to the publish of the state change it causes.
+        """
+        entity_id = service_data.get("entity_id")
+        entity_entry = (
+            er.async_get(self.hass).async_get(entity_id)
+            if isinstance(entity_id, str)
+            else None
+        )
+        trace = XDisplayCommandTrace(
+            screen_type=self.screen_config[CONF_SCREEN_TYPE_NAME],
+            integration=entity_entry.platform if entity_entry else domain,
+            received=_command_received.get() or time.monotonic(),
+            stats=self.hass.data[DOMAIN][self.config_entry.entry_id].commands,
+        )
+        async_get_dispatcher(self.hass).async_call(
+            domain, service, service_data, trace=trace, supersede=supersede
+        )
+
+    @callback
+    def async_create_debouncer(
+        self,
+        cooldown: float,
+        function: Callable[[], Coroutine[Any, Any, None]],
+        *,
+        immediate: bool,
+    ) -> Debouncer:
+        """
+        Create a debouncer shut down when the config entry is unloaded.
+
+        With `immediate`, the first call runs at once and further calls during
+        the cooldown are merged into one run at its end (throttle). Otherwise
+        calls are merged into one run after the cooldown (coalesce). The
+        cooldown is widened with the pacing level. The function runs without
+        state stamp: the context of its timer is the one of the first call of
+        the burst, so it passes the stamp of what it publishes explicitly.
+        """
+
+        async def run_unstamped() -> None:
+            """Run the function without the stamp of the state first handled."""
+            token = _state_stamp.set(None)
+            try:
+                await function()
+            finally:
+                _state_stamp.reset(token)
+
+        debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=cooldown * self.mqtt.pacing.factor,
+            immediate=immediate,
+            function=run_unstamped,
+        )
+
+        @callback
+        def pacing_changed() -> None:
+            """Scale the cooldown to the pacing level."""
+            debouncer.cooldown = cooldown * self.mqtt.pacing.factor
+
+        self.config_entry.async_on_unload(
+            self.mqtt.pacing.async_add_listener(pacing_changed)
+        )
+        self.config_entry.async_on_unload(debouncer.async_shutdown)
+        return debouncer
+
+    async def async_refresh(self) -> None:
+        """Publish the current state of the linked entities."""
+        for entity_id in linked_entity_ids(self.screen_config):
+            if (state := self.hass.states.get(entity_id)) is None:
+                continue
+            await self._async_handle_state(
+                self.update_xdisplay,
+                Event(
+                    EVENT_STATE_CHANGED,
+                    {"entity_id": entity_id, "old_state": None, "new_state": state},
+                ),
+            )
+
+    async def async_resync(self) -> None:
+        """Publish again the whole screen, even values already shown."""
+        await self.async_refresh()
 
     @abstractmethod
     async def update_xdisplay(self, event: Event[EventStateChangedData]) -> None:
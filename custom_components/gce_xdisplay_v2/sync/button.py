@@ -5,13 +5,9 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
-from homeassistant.components.mqtt.client import async_publish
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.event import (
-    async_track_state_change_event,
-)
 
 from custom_components.gce_xdisplay_v2.const import (
     CONF_SCREEN_LINKED_ENTITY,
@@ -48,8 +44,8 @@ class XDisplayButtonSync(XDisplaySync):
             0
         ]
 
-        async_track_state_change_event(
-            hass, [screen_config[CONF_SCREEN_LINKED_ENTITY]], self.update_xdisplay
+        self.async_track_entities(
+            [screen_config[CONF_SCREEN_LINKED_ENTITY]], self.update_xdisplay
         )
 
     async def update_xdisplay(self, event: Event[EventStateChangedData]) -> None:
@@ -64,8 +60,7 @@ class XDisplayButtonSync(XDisplaySync):
             event.data["entity_id"],
             to_state.state,
         )
-        await async_publish(
-            self.hass,
+        await self.async_publish(
             self.topic_pub,
             1 if to_state.state == "on" else 0,
         )
@@ -73,8 +68,9 @@ class XDisplayButtonSync(XDisplaySync):
     async def update_entity(self, msg: ReceiveMessage) -> None:
         """Update the entity."""
         _LOGGER.debug("Action on XDisplay screen #%s: %s", self.screen_id, msg.payload)
-        await self.hass.services.async_call(
+        self.async_call_service(
             self.linked_entity_domain,
             "turn_on" if msg.payload == "1" else "turn_off",
             {"entity_id": self.screen_config[CONF_SCREEN_LINKED_ENTITY]},
+            supersede="turn",
         )
@@ -0,0 +1,204 @@
+"""Sync between entities and X-Display consumption screens."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.helpers.event import async_track_time_interval
+
+from custom_components.gce_xdisplay_v2.const import (
+    CONF_SCREEN_LINKED_ENTITY,
+)
+
+from . import XDisplaySync
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.components.mqtt.models import ReceiveMessage
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import Event, EventStateChangedData, HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+CONSUMPTION_WINDOW = 300
+# Samples kept at most, the oldest dropped first if the sensor updates faster
+CONSUMPTION_MAX_SAMPLES = 1024
+CONSUMPTION_PUBLISH_INTERVAL = timedelta(seconds=10)
+
+
+class XDisplayPowerWindow:
+    """
+    Sliding time window over power samples.
+
+    Each sample holds until the next one, `None` while the sensor is
+    unavailable. Samples are kept in a ring buffer with the running area
+    (value times duration held) for the time-weighted average, and a
+    monotonic queue of decreasing values for the peak, so adding a sample
+    and reading the aggregates are O(1) amortized.
+    """
+
+    def __init__(
+        self, window: float, max_samples: int = CONSUMPTION_MAX_SAMPLES
+    ) -> None:
+        """Initialize the window, length in seconds."""
+        self.window = window
+        self.current: float | None = None
+        self._samples: deque[tuple[float, float | None]] = deque(maxlen=max_samples)
+        self._peaks: deque[tuple[float, float]] = deque(maxlen=max_samples)
+        # Area and duration of the samples followed by another one
+        self._area = 0.0
+        self._duration = 0.0
+        self._now = 0.0
+
+    def add(self, value: float | None, timestamp: float) -> None:
+        """Add a sample, `None` when the sensor becomes unavailable."""
+        if self._samples:
+            last_timestamp, last_value = self._samples[-1]
+            if last_value is not None:
+                self._area += last_value * (timestamp - last_timestamp)
+                self._duration += timestamp - last_timestamp
+        if len(self._samples) == self._samples.maxlen:
+            self._popleft()
+        self.current = value
+        self._samples.append((timestamp, value))
+        if value is not None:
+            while self._peaks and self._peaks[-1][1] <= value:
+                self._peaks.pop()
+            self._peaks.append((timestamp, value))
+        self.expire(timestamp)
+
+    def expire(self, timestamp: float) -> None:
+        """Drop samples ended before the window."""
+        self._now = timestamp
+        limit = timestamp - self.window
+        while len(self._samples) > 1 and self._samples[1][0] <= limit:
+            self._popleft()
+
+    def _popleft(self) -> None:
+        """Drop the oldest sample, with its area and peak."""
+        timestamp, value = self._samples.popleft()
+        if not self._samples:
+            self._area = self._duration = 0.0
+        elif value is not None:
+            held = self._samples[0][0] - timestamp
+            self._area -= value * held
+            self._duration -= held
+        oldest = self._samples[0][0] if self._samples else float("inf")
+        while self._peaks and self._peaks[0][0] < oldest:
+            self._peaks.popleft()
+
+    @property
+    def average(self) -> float | None:
+        """Return the average of the window, weighted by the time held."""
+        if not self._samples:
+            return None
+        area, duration = self._area, self._duration
+        # The oldest sample may have started before the window
+        first_timestamp, first_value = self._samples[0]
+        if (
+            first_value is not None
+            and (outside := self._now - self.window - first_timestamp) > 0
+        ):
+            area -= first_value * outside
+            duration -= outside
+        # The latest sample holds until now
+        last_timestamp, last_value = self._samples[-1]
+        if last_value is not None:
+            area += last_value * (self._now - last_timestamp)
+            duration += self._now - last_timestamp
+        if duration <= 0:
+            return self.current
+        return area / duration
+
+    @property
+    def peak(self) -> float | None:
+        """Return the peak of the window."""
+        if not self._peaks:
+            return None
+        return self._peaks[0][1]
+
+
+class XDisplayConsumptionSync(XDisplaySync):
+    """Sync between power sensor and X-Display consumption screen."""
+
+    deferrable = True
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        screen_id: int,
+        screen_config: dict[str, Any],
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(hass, config_entry, screen_id, screen_config)
+
+        self.pub_topic_current = f"{self.topic_prefix}/Puissance"
+        self.pub_topic_average = f"{self.topic_prefix}/PuissanceMoy"
+        self.pub_topic_peak = f"{self.topic_prefix}/PuissanceMax"
+
+        self.window = XDisplayPowerWindow(CONSUMPTION_WINDOW)
+        self._published: dict[str, int] = {}
+
+        if (state := hass.states.get(screen_config[CONF_SCREEN_LINKED_ENTITY])) and (
+            value := self._parse_power(state.state)
+        ) is not None:
+            self.window.add(value, time.monotonic())
+
+        self.async_track_entities(
+            [screen_config[CONF_SCREEN_LINKED_ENTITY]], self.update_xdisplay
+        )
+        config_entry.async_on_unload(
+            async_track_time_interval(
+                hass, self._async_publish_interval, CONSUMPTION_PUBLISH_INTERVAL
+            )
+        )
+
+    @staticmethod
+    def _parse_power(state: str) -> float | None:
+        """Return the power value of a state."""
+        if state in [STATE_UNAVAILABLE, STATE_UNKNOWN]:
+            return None
+        try:
+            return float(state)
+        except ValueError:
+            return None
+
+    async def update_xdisplay(self, event: Event[EventStateChangedData]) -> None:
+        """Add the power sample to the window, published on schedule."""
+        to_state = event.data["new_state"]
+        self.window.add(
+            None if to_state is None else self._parse_power(to_state.state),
+            time.monotonic(),
+        )
+
+    async def async_refresh(self) -> None:
+        """Publish current, average and peak power."""
+        await self._async_publish_interval()
+
+    async def async_resync(self) -> None:
+        """Publish again current, average and peak power."""
+        self._published = {}
+        await super().async_resync()
+
+    async def _async_publish_interval(self, _: datetime | None = None) -> None:
+        """Publish current, average and peak power when they changed."""
+        self.window.expire(time.monotonic())
+        for topic, value in (
+            (self.pub_topic_current, self.window.current),
+            (self.pub_topic_average, self.window.average),
+            (self.pub_topic_peak, self.window.peak),
+        ):
+            if value is None or self._published.get(topic) == round(value):
+                continue
+            if await self.async_publish(topic, round(value)):
+                self._published[topic] = round(value)
+
+    async def update_entity(self, msg: ReceiveMessage) -> None:
+        """Read only."""
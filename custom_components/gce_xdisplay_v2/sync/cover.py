@@ -5,13 +5,15 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
-from homeassistant.components.mqtt.client import async_publish
+from homeassistant.components.cover import (
+    ATTR_CURRENT_POSITION,
+    ATTR_POSITION,
+    CoverEntityFeature,
+    CoverState,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import ATTR_SUPPORTED_FEATURES, Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.event import (
-    async_track_state_change_event,
-)
 
 from custom_components.gce_xdisplay_v2.const import (
     CONF_SCREEN_LINKED_ENTITY,
@@ -28,6 +30,11 @@ PLATFORMS = [Platform.SENSOR, Platform.SWITCH, Platform.NUMBER]
 
 _LOGGER = logging.getLogger(__name__)
 
+# Minimum delay between two position updates while the cover moves
+COVER_MOTION_RATE_LIMIT = 2
+# Delay without new position from the screen before moving the cover
+COVER_POSITION_DEBOUNCE = 0.5
+
 
 class XDisplayCoverSync(XDisplaySync):
     """Sync between entity and X-Display cover screen."""
@@ -43,10 +50,21 @@ class XDisplayCoverSync(XDisplaySync):
         super().__init__(hass, config_entry, screen_id, screen_config)
 
         self.sub_topic_position = f"{self.topic_prefix}/ShutterPos"
+        self.sub_topic_set_position = f"{self.topic_prefix}/ShutterPosState"
         self.pub_topic_cmd = f"{self.topic_prefix}/ShutterCmd"
+        self.pub_topic_position = f"{self.topic_prefix}/ShutterPosCmd"
+
+        self._published: dict[str, int] = {}
+        self._target_position: int | None = None
+        self._motion_debouncer = self.async_create_debouncer(
+            COVER_MOTION_RATE_LIMIT, self._async_publish_state, immediate=True
+        )
+        self._position_debouncer = self.async_create_debouncer(
+            COVER_POSITION_DEBOUNCE, self._async_set_position, immediate=False
+        )
 
-        async_track_state_change_event(
-            hass, [screen_config[CONF_SCREEN_LINKED_ENTITY]], self.update_xdisplay
+        self.async_track_entities(
+            [screen_config[CONF_SCREEN_LINKED_ENTITY]], self.update_xdisplay
         )
 
     async def update_xdisplay(self, event: Event[EventStateChangedData]) -> None:
@@ -61,13 +79,40 @@ class XDisplayCoverSync(XDisplaySync):
             event.data["entity_id"],
             to_state.state,
         )
-        await async_publish(
-            self.hass,
-            self.pub_topic_cmd,
-            2 if to_state.state == "open" else 1,
-        )
+        if to_state.state in [CoverState.OPENING, CoverState.CLOSING]:
+            # Moving, position is published at most every rate limit
+            await self._motion_debouncer.async_call()
+        else:
+            # At rest, final position is published at once
+            self._motion_debouncer.async_cancel()
+            await self._async_publish_state()
 
-    async def update_entity(self, msg: ReceiveMessage) -> None:
+    async def _async_publish_state(self) -> None:
+        """Publish the state and position of the cover when they changed."""
+        state = self.hass.states.get(self.screen_config[CONF_SCREEN_LINKED_ENTITY])
+        if state is None or state.state in ["unavailable", "unknown"]:
+            return
+        payloads = {}
+        if state.state in [CoverState.OPEN, CoverState.CLOSED]:
+            payloads[self.pub_topic_cmd] = 2 if state.state == CoverState.OPEN else 1
+        if (position := state.attributes.get(ATTR_CURRENT_POSITION)) is not None:
+            payloads[self.pub_topic_position] = int(position)
+        for topic, payload in payloads.items():
+            if self._published.get(topic) == payload:
+                continue
+            if await self.async_publish(
+                topic, payload, stamp=state.last_updated_timestamp
+            ):
+                self._published[topic] = payload
+
+    async def async_resync(self) -> None:
+        """Publish again the state and position, even if already published."""
+        self._published = {}
+        await super().async_resync()
+
+    async def update_entity(
+        self, msg: ReceiveMessage, action: str | None = None
+    ) -> None:
         """Update the entity."""
         _LOGGER.debug(
             "XDisplay published for screen #%s:\ntopic: %s\npayload: %s",
@@ -75,8 +120,46 @@ class XDisplayCoverSync(XDisplaySync):
             msg.topic,
             msg.payload,
         )
-        await self.hass.services.async_call(
+        if action == "set_cover_position":
+            try:
+                self._target_position = max(0, min(100, round(float(msg.payload))))
+            except ValueError:
+                _LOGGER.warning(
+                    "Invalid position on XDisplay screen #%s: %s",
+                    self.screen_id,
+                    msg.payload,
+                )
+                return
+            await self._position_debouncer.async_call()
+            return
+        self.async_call_service(
             "cover",
             "open_cover" if msg.payload == "1" else "close_cover",
             {"entity_id": self.screen_config[CONF_SCREEN_LINKED_ENTITY]},
+            supersede="move",
+        )
+
+    async def _async_set_position(self) -> None:
+        """Move the cover to the latest position received."""
+        if (position := self._target_position) is None:
+            return
+        self._target_position = None
+        entity_id = self.screen_config[CONF_SCREEN_LINKED_ENTITY]
+        state = self.hass.states.get(entity_id)
+        supported_features = (
+            state.attributes.get(ATTR_SUPPORTED_FEATURES, 0) if state else 0
         )
+        if supported_features & CoverEntityFeature.SET_POSITION:
+            self.async_call_service(
+                "cover",
+                "set_cover_position",
+                {"entity_id": entity_id, ATTR_POSITION: position},
+                supersede="move",
+            )
+        else:
+            self.async_call_service(
+                "cover",
+                "open_cover" if position >= 50 else "close_cover",  # noqa: PLR2004
+                {"entity_id": entity_id},
+                supersede="move",
+            )
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import datetime
 import logging
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 import pytz
@@ -12,30 +13,58 @@ from homeassistant.components.energy.data import (
     EnergyPreferences,
     async_get_manager,
 )
-from homeassistant.components.mqtt.client import async_publish
 from homeassistant.components.recorder.statistics import (
     statistics_during_period,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.recorder import get_instance
 
+from custom_components.gce_xdisplay_v2.const import DATA_ENERGY_SYNCS
+
 from . import XDisplaySync
 
 if TYPE_CHECKING:
     from homeassistant.components.mqtt.models import ReceiveMessage
     from homeassistant.config_entries import ConfigEntry
-    from homeassistant.core import HomeAssistant
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
 
 PLATFORMS = [Platform.SENSOR, Platform.SWITCH, Platform.NUMBER]
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@callback
+def async_listen_preferences_updates(
+    hass: HomeAssistant, energy_manager: EnergyManager, sync: XDisplayEnergySync
+) -> CALLBACK_TYPE:
+    """
+    Notify an energy sync of preferences updates, return the remove callback.
+
+    The energy manager has no way to remove a listener, so a single one is
+    added, forwarding updates to the energy syncs currently set up.
+    """
+    syncs: set[XDisplayEnergySync] | None = hass.data.get(DATA_ENERGY_SYNCS)
+    if syncs is None:
+        syncs = hass.data[DATA_ENERGY_SYNCS] = set()
+
+        async def preferences_updated() -> None:
+            """Forward the update to the energy syncs."""
+            for energy_sync in list(syncs):
+                await energy_sync.async_preferences_updated()
+
+        energy_manager.async_listen_updates(preferences_updated)
+
+    syncs.add(sync)
+    return partial(syncs.discard, sync)
+
+
 class XDisplayEnergySync(XDisplaySync):
     """Sync between entity and X-Display energy distribution screen."""
 
+    deferrable = True
+
     energy_manager: EnergyManager | None
 
     def __init__(
@@ -54,132 +83,139 @@ class XDisplayEnergySync(XDisplaySync):
         self.pub_topic_soutire = f"{self.topic_prefix}/Soutire"
         self.pub_topic_injecte = f"{self.topic_prefix}/Injecte"
 
+        # Statistics summed for each topic, several tariffs or sources
         self.entities: list[str] = []
-        self.entity_ids_consumption: list[str] = []
-        self.entity_id_production: str | None = None
-        self.entity_id_charge: str | None = None
-        self.entity_id_discharge: str | None = None
-        self.entity_id_soutire: str | None = None
-        self.entity_id_injecte: str | None = None
+        self.entity_ids_production: list[str] = []
+        self.entity_ids_charge: list[str] = []
+        self.entity_ids_discharge: list[str] = []
+        self.entity_ids_soutire: list[str] = []
+        self.entity_ids_injecte: list[str] = []
+
+        # Last values of today, kept for resync
+        self.values: dict[str, float] = {}
 
     async def initialize(self) -> None:
         """Get energy manager."""
         _LOGGER.debug("Initialize energy distribution data")
         self.energy_manager = await async_get_manager(self.hass)
-        self.energy_manager.async_listen_updates(self.update_xdisplay)
+        self.config_entry.async_on_unload(
+            async_listen_preferences_updates(self.hass, self.energy_manager, self)
+        )
 
         if not self.energy_manager.data:
             _LOGGER.debug("No energy data available")
         else:
             self._process_energy_sources(self.energy_manager.data)
             self._extend_entities()
+
+    async def async_refresh(self) -> None:
+        """Publish the statistics of today."""
+        await self.update_xdisplay()
+
+    async def async_resync(self) -> None:
+        """Publish the last statistics, queried only if there are none."""
+        if not self.values:
             await self.update_xdisplay()
+            return
+        for topic, value in self.values.items():
+            await self.async_publish(topic, round(value, 3))
+
+    async def async_preferences_updated(self) -> None:
+        """Reload energy sources and publish them."""
+        if self.energy_manager is None or not self.energy_manager.data:
+            return
+        self._process_energy_sources(self.energy_manager.data)
+        self._extend_entities()
+        await self.update_xdisplay()
 
     def _process_energy_sources(self, energy_preferences: EnergyPreferences) -> None:
         """Process energy sources."""
+        self.entity_ids_production = []
+        self.entity_ids_charge = []
+        self.entity_ids_discharge = []
+        self.entity_ids_soutire = []
+        self.entity_ids_injecte = []
         for energy in energy_preferences["energy_sources"]:
             if energy["type"] == "grid":
-                self.entity_ids_consumption = [
+                self.entity_ids_soutire.extend(
                     stat_id["stat_energy_from"] for stat_id in energy["flow_from"]
-                ]
+                )
+                self.entity_ids_injecte.extend(
+                    stat_id["stat_energy_to"] for stat_id in energy["flow_to"]
+                )
             elif energy["type"] == "solar":
-                self.entity_id_production = energy["stat_energy_from"]
+                self.entity_ids_production.append(energy["stat_energy_from"])
             elif energy["type"] == "battery":
-                self.entity_id_charge = energy["stat_energy_to"]
-                self.entity_id_discharge = energy["stat_energy_from"]
+                self.entity_ids_charge.append(energy["stat_energy_to"])
+                self.entity_ids_discharge.append(energy["stat_energy_from"])
             else:
                 _LOGGER.debug("Energy type %s not compatible", energy["type"])
 
     def _extend_entities(self) -> None:
         """Extend entities list."""
-        if self.entity_ids_consumption:
-            self.entities.extend(self.entity_ids_consumption)
-        if self.entity_id_production:
-            self.entities.append(self.entity_id_production)
-        if self.entity_id_charge:
-            self.entities.append(self.entity_id_charge)
-        if self.entity_id_discharge:
-            self.entities.append(self.entity_id_discharge)
-        if self.entity_id_soutire:
-            self.entities.append(self.entity_id_soutire)
-        if self.entity_id_injecte:
-            self.entities.append(self.entity_id_injecte)
+        self.entities = [
+            *self.entity_ids_soutire,
+            *self.entity_ids_injecte,
+            *self.entity_ids_production,
+            *self.entity_ids_charge,
+            *self.entity_ids_discharge,
+        ]
 
     async def update_xdisplay(self) -> None:
         """Publish updated MQTT state from entity watched."""
         _LOGGER.debug("Update energy distribution data")
-        if self.entities:
-            stats = await get_instance(self.hass).async_add_executor_job(
-                statistics_during_period,
-                self.hass,
-                datetime.datetime.combine(
-                    datetime.datetime.now(
-                        tz=pytz.timezone(self.hass.config.time_zone)
-                    ).date(),
-                    datetime.time.min,
-                ),
-                None,
-                self.entities,
-                "day",
-                None,
-                {"change"},
+        if not self.entities:
+            return
+        # A single query for all statistics of today
+        stats = await get_instance(self.hass).async_add_executor_job(
+            statistics_during_period,
+            self.hass,
+            datetime.datetime.combine(
+                datetime.datetime.now(
+                    tz=pytz.timezone(self.hass.config.time_zone)
+                ).date(),
+                datetime.time.min,
+            ),
+            None,
+            set(self.entities),
+            "day",
+            None,
+            {"change"},
+        )
+        changes: dict[str, float] = {}
+        for entity_id, stat in stats.items():
+            if not stat or stat[-1].get("change") is None:
+                _LOGGER.debug("No stat for %s", entity_id)
+                continue
+            changes[entity_id] = stat[-1]["change"]
+
+        values: dict[str, float] = {}
+        for topic, entity_ids in (
+            (self.pub_topic_soutire, self.entity_ids_soutire),
+            (self.pub_topic_injecte, self.entity_ids_injecte),
+            (self.pub_topic_production, self.entity_ids_production),
+            (self.pub_topic_charge, self.entity_ids_charge),
+            (self.pub_topic_discharge, self.entity_ids_discharge),
+        ):
+            if entity_ids:
+                values[topic] = sum(
+                    changes.get(entity_id, 0) for entity_id in entity_ids
+                )
+        # Home consumption, what is not exported or stored
+        if self.entity_ids_soutire or self.entity_ids_production:
+            values[self.pub_topic_consumption] = max(
+                0,
+                values.get(self.pub_topic_soutire, 0)
+                + values.get(self.pub_topic_production, 0)
+                - values.get(self.pub_topic_injecte, 0)
+                + values.get(self.pub_topic_discharge, 0)
+                - values.get(self.pub_topic_charge, 0),
             )
-            for entity_id, stat in stats.items():
-                if "change" not in stat[-1]:
-                    _LOGGER.debug("No stat for %s", entity_id)
-                    continue
-                value = stat[-1]["change"]
-                if (
-                    self.entity_ids_consumption
-                    and entity_id in self.entity_ids_consumption
-                ):
-                    _LOGGER.debug("Publishing consumption: %s", value)
-                    await async_publish(
-                        self.hass,
-                        self.pub_topic_consumption,
-                        value,
-                        retain=True,
-                    )
-                elif entity_id == self.entity_id_production:
-                    _LOGGER.debug("Publishing production: %s", value)
-                    await async_publish(
-                        self.hass,
-                        self.pub_topic_production,
-                        value,
-                        retain=True,
-                    )
-                elif entity_id == self.entity_id_charge:
-                    _LOGGER.debug("Publishing charge: %s", value)
-                    await async_publish(
-                        self.hass,
-                        self.pub_topic_charge,
-                        value,
-                        retain=True,
-                    )
-                elif entity_id == self.entity_id_discharge:
-                    _LOGGER.debug("Publishing discharge: %s", value)
-                    await async_publish(
-                        self.hass,
-                        self.pub_topic_discharge,
-                        value,
-                        retain=True,
-                    )
-                elif entity_id == self.entity_id_soutire:
-                    _LOGGER.debug("Publishing soutire: %s", value)
-                    await async_publish(
-                        self.hass,
-                        self.pub_topic_soutire,
-                        value,
-                        retain=True,
-                    )
-                elif entity_id == self.entity_id_injecte:
-                    _LOGGER.debug("Publishing injecte: %s", value)
-                    await async_publish(
-                        self.hass,
-                        self.pub_topic_injecte,
-                        value,
-                        retain=True,
-                    )
+
+        self.values = values
+        for topic, value in values.items():
+            _LOGGER.debug("Publishing %s: %s", topic, value)
+            await self.async_publish(topic, round(value, 3))
 
     async def update_entity(self, msg: ReceiveMessage) -> None:
         """Update the entity."""
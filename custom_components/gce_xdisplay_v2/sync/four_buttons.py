@@ -0,0 +1,87 @@
+"""Sync between entities and X-Display four buttons screens."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import STATE_ON, STATE_UNAVAILABLE, STATE_UNKNOWN
+
+from . import XDisplaySync, linked_entity_ids
+
+if TYPE_CHECKING:
+    from homeassistant.components.mqtt.models import ReceiveMessage
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import Event, EventStateChangedData, HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+# Delay to gather state changes of a burst (scene, group) in one publish pass
+COALESCE_DELAY = 0.1
+
+
+class XDisplayFourButtonsSync(XDisplaySync):
+    """Sync between up to four entities and X-Display four buttons screen."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        screen_id: int,
+        screen_config: dict[str, Any],
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(hass, config_entry, screen_id, screen_config)
+
+        self.entity_ids = linked_entity_ids(screen_config)
+        self.topics_sub = [
+            f"{self.topic_prefix}/IoState{index + 1}"
+            for index in range(len(self.entity_ids))
+        ]
+        self.topics_pub = [
+            f"{self.topic_prefix}/IoCmd{index + 1}"
+            for index in range(len(self.entity_ids))
+        ]
+        self._changed: set[int] = set()
+        self._debouncer = self.async_create_debouncer(
+            COALESCE_DELAY, self._async_publish_changed, immediate=False
+        )
+
+        self.async_track_entities(self.entity_ids, self.update_xdisplay)
+
+    async def update_xdisplay(self, event: Event[EventStateChangedData]) -> None:
+        """Mark the watched entity as changed, publish after the burst."""
+        _LOGGER.debug("Watched entity %s has changed", event.data["entity_id"])
+        self._changed.add(self.entity_ids.index(event.data["entity_id"]))
+        await self._debouncer.async_call()
+
+    async def _async_publish_changed(self) -> None:
+        """Publish the latest state of entities changed since last pass."""
+        # Entities changed while publishing are picked up in the same pass
+        while self._changed:
+            index = min(self._changed)
+            self._changed.discard(index)
+            state = self.hass.states.get(self.entity_ids[index])
+            if state is None or state.state in [STATE_UNAVAILABLE, STATE_UNKNOWN]:
+                continue
+            await self.async_publish(
+                self.topics_pub[index],
+                1 if state.state == STATE_ON else 0,
+                stamp=state.last_updated_timestamp,
+            )
+
+    async def update_entity(self, msg: ReceiveMessage, index: int) -> None:
+        """Update the entity of the pressed button."""
+        _LOGGER.debug(
+            "Action on XDisplay screen #%s button %s: %s",
+            self.screen_id,
+            index + 1,
+            msg.payload,
+        )
+        entity_id = self.entity_ids[index]
+        self.async_call_service(
+            entity_id.split(".")[0],
+            "turn_on" if msg.payload == "1" else "turn_off",
+            {"entity_id": entity_id},
+            supersede="turn",
+        )
@@ -0,0 +1,192 @@
+"""Sync between entities and X-Display home summary screens."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.alarm_control_panel import AlarmControlPanelState
+from homeassistant.components.alarm_control_panel.const import (
+    DOMAIN as ALARM_CONTROL_PANEL_DOMAIN,
+)
+from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.components.cover import CoverState
+from homeassistant.components.cover.const import DOMAIN as COVER_DOMAIN
+from homeassistant.components.light.const import DOMAIN as LIGHT_DOMAIN
+from homeassistant.const import ATTR_DEVICE_CLASS, STATE_ON
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.gce_xdisplay_v2.const import (
+    CONF_SCREEN_AREA,
+    XDISPLAY_SCREEN_TYPE_DOMAINS,
+    XDisplayScreenTypes,
+)
+
+from . import XDisplaySync, linked_entity_ids
+
+if TYPE_CHECKING:
+    from homeassistant.components.mqtt.models import ReceiveMessage
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import (
+        Event,
+        EventStateChangedData,
+        HomeAssistant,
+        State,
+    )
+
+_LOGGER = logging.getLogger(__name__)
+
+# Delay to gather state changes of a burst (scene, all lights off) in one publish
+HOME_COALESCE_DELAY = 0.5
+
+OPENING_DEVICE_CLASSES = {
+    BinarySensorDeviceClass.DOOR,
+    BinarySensorDeviceClass.GARAGE_DOOR,
+    BinarySensorDeviceClass.OPENING,
+    BinarySensorDeviceClass.WINDOW,
+}
+OPEN_COVER_STATES = {CoverState.OPEN, CoverState.OPENING, CoverState.CLOSING}
+
+# Alarm shown by the screen: 0 disarmed, 1 armed, 2 arming, 3 triggered
+ALARM_PAYLOADS = {
+    AlarmControlPanelState.DISARMED: 0,
+    AlarmControlPanelState.DISARMING: 0,
+    AlarmControlPanelState.ARMED_HOME: 1,
+    AlarmControlPanelState.ARMED_AWAY: 1,
+    AlarmControlPanelState.ARMED_NIGHT: 1,
+    AlarmControlPanelState.ARMED_VACATION: 1,
+    AlarmControlPanelState.ARMED_CUSTOM_BYPASS: 1,
+    AlarmControlPanelState.ARMING: 2,
+    AlarmControlPanelState.PENDING: 2,
+    AlarmControlPanelState.TRIGGERED: 3,
+}
+
+
+def area_entity_ids(hass: HomeAssistant, area_id: str) -> list[str]:
+    """Return the entities of an area, directly or through their device."""
+    entity_registry = er.async_get(hass)
+    entity_ids = {
+        entry.entity_id for entry in er.async_entries_for_area(entity_registry, area_id)
+    }
+    for device in dr.async_entries_for_area(dr.async_get(hass), area_id):
+        entity_ids.update(
+            entry.entity_id
+            for entry in er.async_entries_for_device(entity_registry, device.id)
+            if entry.area_id is None
+        )
+    domains = XDISPLAY_SCREEN_TYPE_DOMAINS[XDisplayScreenTypes.HOME.name]
+    return sorted(
+        entity_id for entity_id in entity_ids if entity_id.split(".")[0] in domains
+    )
+
+
+class XDisplayHomeSync(XDisplaySync):
+    """
+    Sync between a set of entities and X-Display home summary screen.
+
+    Lights on and openings are kept as sets of entity ids, updated from the
+    state changes of the members only, so each change costs O(1) whatever
+    the number of entities in Home Assistant.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        screen_id: int,
+        screen_config: dict[str, Any],
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(hass, config_entry, screen_id, screen_config)
+
+        self.pub_topic_lights = f"{self.topic_prefix}/HomeLights"
+        self.pub_topic_openings = f"{self.topic_prefix}/HomeOpenings"
+        self.pub_topic_alarm = f"{self.topic_prefix}/HomeAlarm"
+
+        # Members resolved once, the area ones on reload
+        self.entity_ids = linked_entity_ids(screen_config)
+        if area_id := screen_config.get(CONF_SCREEN_AREA):
+            self.entity_ids = sorted(
+                {*self.entity_ids, *area_entity_ids(hass, area_id)}
+            )
+        self.alarm_entity_id = next(
+            (
+                entity_id
+                for entity_id in self.entity_ids
+                if entity_id.split(".")[0] == ALARM_CONTROL_PANEL_DOMAIN
+            ),
+            None,
+        )
+
+        self.lights_on: set[str] = set()
+        self.openings: set[str] = set()
+        self.alarm: int | None = None
+        self._published: dict[str, int] = {}
+        # Newest member state change, stamp of the counters published
+        self._stamp: float | None = None
+        self._debouncer = self.async_create_debouncer(
+            HOME_COALESCE_DELAY, self._async_publish_counters, immediate=False
+        )
+
+        for entity_id in self.entity_ids:
+            self._update_member(entity_id, hass.states.get(entity_id))
+        self.async_track_entities(self.entity_ids, self.update_xdisplay)
+
+    def _update_member(self, entity_id: str, state: State | None) -> None:
+        """Update the counters with the new state of a member."""
+        domain = entity_id.split(".")[0]
+        if domain == LIGHT_DOMAIN:
+            if state is not None and state.state == STATE_ON:
+                self.lights_on.add(entity_id)
+            else:
+                self.lights_on.discard(entity_id)
+        elif domain in (COVER_DOMAIN, BINARY_SENSOR_DOMAIN):
+            if state is not None and (
+                state.state in OPEN_COVER_STATES
+                if domain == COVER_DOMAIN
+                else state.state == STATE_ON
+                and state.attributes.get(ATTR_DEVICE_CLASS) in OPENING_DEVICE_CLASSES
+            ):
+                self.openings.add(entity_id)
+            else:
+                self.openings.discard(entity_id)
+        elif entity_id == self.alarm_entity_id:
+            self.alarm = None if state is None else ALARM_PAYLOADS.get(state.state)
+
+    async def async_refresh(self) -> None:
+        """Publish all the counters, even unchanged."""
+        self._published = {}
+        await self._async_publish_counters()
+
+    async def update_xdisplay(self, event: Event[EventStateChangedData]) -> None:
+        """Update the counters, publish after the burst."""
+        new_state = event.data["new_state"]
+        self._update_member(event.data["entity_id"], new_state)
+        stamp = (
+            event.time_fired_timestamp
+            if new_state is None
+            else new_state.last_updated_timestamp
+        )
+        self._stamp = max(stamp, self._stamp or stamp)
+        await self._debouncer.async_call()
+
+    async def _async_publish_counters(self) -> None:
+        """Publish the counters changed since last publish."""
+        for topic, value in (
+            (self.pub_topic_lights, len(self.lights_on)),
+            (self.pub_topic_openings, len(self.openings)),
+            (self.pub_topic_alarm, self.alarm),
+        ):
+            if value is None:
+                # No payload for an unknown alarm state, republished on recovery
+                self._published.pop(topic, None)
+                continue
+            if self._published.get(topic) == value:
+                continue
+            if await self.async_publish(topic, value, stamp=self._stamp):
+                self._published[topic] = value
+
+    async def update_entity(self, msg: ReceiveMessage) -> None:
+        """Read only."""
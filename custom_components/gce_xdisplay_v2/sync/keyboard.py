@@ -0,0 +1,237 @@
+"""Sync between an alarm and X-Display keyboard screens."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.alarm_control_panel import AlarmControlPanelState
+from homeassistant.components.alarm_control_panel.const import (
+    DOMAIN as ALARM_CONTROL_PANEL_DOMAIN,
+)
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
+
+from custom_components.gce_xdisplay_v2.const import CONF_SCREEN_LINKED_ENTITY
+
+from . import XDisplaySync
+from .home import ALARM_PAYLOADS
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.components.mqtt.models import ReceiveMessage
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import (
+        CALLBACK_TYPE,
+        Event,
+        EventStateChangedData,
+        HomeAssistant,
+    )
+
+_LOGGER = logging.getLogger(__name__)
+
+# Delay without keypress after which the code typed is cleared
+KEYBOARD_TIMEOUT = 10
+KEYBOARD_CODE_MAX_LENGTH = 16
+# Delay for the alarm to change state after a code, longer than the command
+# timeout so failed service calls are counted too
+KEYBOARD_STATE_TIMEOUT = 15
+# Codes submitted without the alarm changing state before lockout
+KEYBOARD_MAX_ATTEMPTS = 3
+# First lockout, doubled on each lockout until the alarm changes state
+KEYBOARD_LOCKOUT = 30
+KEYBOARD_LOCKOUT_MAX = 900
+
+KEY_CLEAR = "C"
+# Keys submitting the code typed, with the service called
+KEY_SERVICES = {
+    "H": "alarm_arm_home",
+    "A": "alarm_arm_away",
+    "N": "alarm_arm_night",
+    "D": "alarm_disarm",
+}
+# States reached by a service call with a valid code
+SERVICE_STATES = {
+    "alarm_arm_home": {
+        AlarmControlPanelState.ARMING,
+        AlarmControlPanelState.ARMED_HOME,
+    },
+    "alarm_arm_away": {
+        AlarmControlPanelState.ARMING,
+        AlarmControlPanelState.ARMED_AWAY,
+    },
+    "alarm_arm_night": {
+        AlarmControlPanelState.ARMING,
+        AlarmControlPanelState.ARMED_NIGHT,
+    },
+    "alarm_disarm": {AlarmControlPanelState.DISARMED},
+}
+
+
+class XDisplayKeyboardSync(XDisplaySync):
+    """
+    Sync between an alarm control panel and X-Display keyboard screen.
+
+    Keys are buffered in memory and the code is only sent with the arm or
+    disarm key, in a single service call. Codes not followed by the expected
+    alarm state within `KEYBOARD_STATE_TIMEOUT`, or replaced by another code
+    before, are counted, and keys are ignored for a while after
+    `KEYBOARD_MAX_ATTEMPTS` of them.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        screen_id: int,
+        screen_config: dict[str, Any],
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(hass, config_entry, screen_id, screen_config)
+
+        self.topic_sub = f"{self.topic_prefix}/KeyState"
+        self.topic_pub = f"{self.topic_prefix}/AlarmCmd"
+        self.mqtt.redacted_topics.add(self.topic_sub)
+
+        self._code = ""
+        self._cancel_timeout: CALLBACK_TYPE | None = None
+        # Service submitted, waiting for the alarm state it leads to
+        self._pending_service: str | None = None
+        self._cancel_pending: CALLBACK_TYPE | None = None
+        self.attempts = 0
+        self.lockouts = 0
+        self._locked_until = 0.0
+
+        config_entry.async_on_unload(self._async_clear_code)
+        config_entry.async_on_unload(self._async_clear_pending)
+        self.async_track_entities(
+            [screen_config[CONF_SCREEN_LINKED_ENTITY]], self.update_xdisplay
+        )
+
+    async def update_xdisplay(self, event: Event[EventStateChangedData]) -> None:
+        """Publish the alarm state, end the lockout once a code worked."""
+        if (to_state := event.data["new_state"]) is None:
+            return
+        if (
+            self._pending_service is not None
+            and to_state.state in SERVICE_STATES[self._pending_service]
+        ):
+            self._async_clear_pending()
+            self.attempts = 0
+            self.lockouts = 0
+        if (payload := ALARM_PAYLOADS.get(to_state.state)) is None:
+            return
+        _LOGGER.debug(
+            "Watched entity %s has changed: %s",
+            event.data["entity_id"],
+            to_state.state,
+        )
+        await self.async_publish(self.topic_pub, payload)
+
+    async def update_entity(self, msg: ReceiveMessage) -> None:
+        """Buffer a key, or submit the code typed."""
+        key = str(msg.payload)
+        if time.monotonic() < self._locked_until:
+            _LOGGER.debug("Screen #%s: keyboard locked, key ignored", self.screen_id)
+            return
+        if key.isdigit() and len(key) == 1:
+            if len(self._code) < KEYBOARD_CODE_MAX_LENGTH:
+                self._code += key
+            self._async_restart_timeout()
+        elif key == KEY_CLEAR:
+            self._async_clear_code()
+        elif (service := KEY_SERVICES.get(key)) is not None:
+            self._async_submit(service)
+        else:
+            _LOGGER.warning("Screen #%s: unknown key received", self.screen_id)
+
+    @callback
+    def _async_submit(self, service: str) -> None:
+        """Call the alarm service with the code typed, count the attempt."""
+        code = self._code
+        self._async_clear_code()
+        # The previous code is superseded before having any effect
+        if self._pending_service is not None:
+            self._async_code_failed()
+            if time.monotonic() < self._locked_until:
+                return
+        entity_id = self.screen_config[CONF_SCREEN_LINKED_ENTITY]
+        if (
+            state := self.hass.states.get(entity_id)
+        ) is None or state.state not in SERVICE_STATES[service]:
+            self._async_wait_state(service)
+        _LOGGER.debug("Screen #%s: submitting %s", self.screen_id, service)
+        self.async_call_service(
+            ALARM_CONTROL_PANEL_DOMAIN,
+            service,
+            {"entity_id": entity_id} | ({"code": code} if code else {}),
+            supersede="alarm",
+        )
+
+    @callback
+    def _async_wait_state(self, service: str) -> None:
+        """Count the code as failed without the state of the service in time."""
+        self._pending_service = service
+
+        @callback
+        def state_timeout_reached(_: datetime) -> None:
+            """Count the code as failed."""
+            self._cancel_pending = None
+            self._async_code_failed()
+
+        self._cancel_pending = async_call_later(
+            self.hass, KEYBOARD_STATE_TIMEOUT, state_timeout_reached
+        )
+
+    @callback
+    def _async_code_failed(self) -> None:
+        """Count a code without effect, lock the keyboard after too many."""
+        self._async_clear_pending()
+        self.attempts += 1
+        if self.attempts < KEYBOARD_MAX_ATTEMPTS:
+            return
+        lockout = min(KEYBOARD_LOCKOUT * 2**self.lockouts, KEYBOARD_LOCKOUT_MAX)
+        _LOGGER.warning(
+            "Screen #%s: %s codes without effect, keyboard locked for %ss",
+            self.screen_id,
+            self.attempts,
+            lockout,
+        )
+        self._async_clear_code()
+        self._locked_until = time.monotonic() + lockout
+        self.lockouts += 1
+        self.attempts = 0
+
+    @callback
+    def _async_clear_pending(self) -> None:
+        """Stop waiting for the state of the service submitted."""
+        self._pending_service = None
+        if self._cancel_pending is not None:
+            self._cancel_pending()
+            self._cancel_pending = None
+
+    @callback
+    def _async_restart_timeout(self) -> None:
+        """Clear the code typed after a delay without keypress."""
+        if self._cancel_timeout is not None:
+            self._cancel_timeout()
+
+        @callback
+        def timeout_reached(_: datetime) -> None:
+            """Clear the code typed."""
+            self._cancel_timeout = None
+            self._code = ""
+
+        self._cancel_timeout = async_call_later(
+            self.hass, KEYBOARD_TIMEOUT, timeout_reached
+        )
+
+    @callback
+    def _async_clear_code(self) -> None:
+        """Clear the code typed and its timeout."""
+        self._code = ""
+        if self._cancel_timeout is not None:
+            self._cancel_timeout()
+            self._cancel_timeout = None
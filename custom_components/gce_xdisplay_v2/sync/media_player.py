@@ -5,13 +5,9 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
-from homeassistant.components.mqtt.client import async_publish
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.event import (
-    async_track_state_change_event,
-)
 
 from custom_components.gce_xdisplay_v2.const import (
     CONF_SCREEN_LINKED_ENTITY,
@@ -32,6 +28,8 @@ _LOGGER = logging.getLogger(__name__)
 class XDisplayMediaPlayerSync(XDisplaySync):
     """Sync between entity and X-Display media player screen."""
 
+    deferrable = True
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -60,8 +58,8 @@ class XDisplayMediaPlayerSync(XDisplaySync):
         self.pub_topic_random = f"{self.topic_prefix}/PlayerRandomCmd"
         self.pub_topic_loop = f"{self.topic_prefix}/PlayerLoopCmd"
 
-        async_track_state_change_event(
-            hass, [screen_config[CONF_SCREEN_LINKED_ENTITY]], self.update_xdisplay
+        self.async_track_entities(
+            [screen_config[CONF_SCREEN_LINKED_ENTITY]], self.update_xdisplay
         )
 
     async def update_xdisplay(self, event: Event[EventStateChangedData]) -> None:
@@ -72,23 +70,19 @@ class XDisplayMediaPlayerSync(XDisplaySync):
         ]:
             return
         _LOGGER.debug(
-            "Watched entity %s has changed: %s (attributes %s)",
+            "Watched entity %s has changed: %s",
             event.data["entity_id"],
             to_state.state,
-            to_state.attributes,
         )
-        await async_publish(
-            self.hass,
+        await self.async_publish(
             self.pub_topic_pause,
             0 if to_state.state == "playing" else 1,
         )
-        await async_publish(
-            self.hass,
+        await self.async_publish(
             self.pub_topic_mute,
             1 if to_state.attributes.get("is_volume_muted") else 0,
         )
-        await async_publish(
-            self.hass,
+        await self.async_publish(
             self.pub_topic_loop,
             1
             if to_state.attributes.get("repeat") == "one"
@@ -96,8 +90,7 @@ class XDisplayMediaPlayerSync(XDisplaySync):
             if to_state.attributes.get("repeat") == "all"
             else 0,
         )
-        await async_publish(
-            self.hass,
+        await self.async_publish(
             self.pub_topic_random,
             1 if to_state.attributes.get("shuffle") else 0,
         )
@@ -121,32 +114,35 @@ class XDisplayMediaPlayerSync(XDisplaySync):
             ]
             and msg.payload == "1"
         ):
-            await self.hass.services.async_call(
+            self.async_call_service(
                 "media_player",
                 action,
                 {"entity_id": self.screen_config[CONF_SCREEN_LINKED_ENTITY]},
             )
         elif action == "media_play_pause":
-            await self.hass.services.async_call(
+            self.async_call_service(
                 "media_player",
                 "media_pause" if msg.payload == "1" else "media_play",
                 {"entity_id": self.screen_config[CONF_SCREEN_LINKED_ENTITY]},
+                supersede="play_pause",
             )
         elif action == "repeat_set":
-            await self.hass.services.async_call(
+            self.async_call_service(
                 "media_player",
                 "repeat_set",
                 {
                     "entity_id": self.screen_config[CONF_SCREEN_LINKED_ENTITY],
                     "repeat": "one" if msg.payload == "1" else "off",
                 },
+                supersede="repeat_set",
             )
         elif action == "shuffle_set":
-            await self.hass.services.async_call(
+            self.async_call_service(
                 "media_player",
                 "shuffle_set",
                 {
                     "entity_id": self.screen_config[CONF_SCREEN_LINKED_ENTITY],
                     "shuffle": msg.payload == "1",
                 },
+                supersede="shuffle_set",
             )
@@ -2,36 +2,122 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
 from typing import TYPE_CHECKING, Any
 
-from homeassistant.components.mqtt.client import async_publish
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.event import (
-    async_track_state_change_event,
+    TrackTemplate,
+    TrackTemplateResult,
+    async_track_template_result,
 )
+from homeassistant.helpers.template import Template
 
 from custom_components.gce_xdisplay_v2.const import (
-    CONF_SCREEN_LINKED_ENTITY,
+    AGGREGATE_MAX,
+    AGGREGATE_MEAN,
+    CONF_SCREEN_AGGREGATE,
+    CONF_SCREEN_DEADBAND,
+    CONF_SCREEN_DEADBAND_MODE,
+    CONF_SCREEN_PRECISION,
+    CONF_SCREEN_TEMPLATE,
+    DEADBAND_MODE_RELATIVE,
+    TRACE_DEADBAND,
 )
 
-from . import XDisplaySync
+from . import XDisplaySync, linked_entity_ids
 
 if TYPE_CHECKING:
     from homeassistant.components.mqtt.models import ReceiveMessage
     from homeassistant.config_entries import ConfigEntry
-    from homeassistant.core import Event, EventStateChangedData, HomeAssistant
+    from homeassistant.core import (
+        Event,
+        EventStateChangedData,
+        HomeAssistant,
+        State,
+    )
 
 PLATFORMS = [Platform.SENSOR, Platform.SWITCH, Platform.NUMBER]
 
 _LOGGER = logging.getLogger(__name__)
 
+AGGREGATE_DEFAULT_PRECISION = 1
+AGGREGATE_HEAP_SLACK = 16
+
+
+class XDisplaySensorAggregate:
+    """
+    Mean, min or max of several sensors, updated incrementally.
+
+    The mean uses a running sum. The min and max use a heap whose outdated
+    entries are only dropped when they reach the top, and which is rebuilt
+    when outdated entries outnumber the sensors. Unavailable sensors are left
+    out until they report a number again.
+    """
+
+    def __init__(self, function: str) -> None:
+        """Initialize the aggregate."""
+        self.function = function
+        # Last update of the member states, to order publishes
+        self.stamp: float | None = None
+        self._values: dict[str, float] = {}
+        self._sum = 0.0
+        # Values are negated for max, heapq being a min heap
+        self._sign = -1 if function == AGGREGATE_MAX else 1
+        self._heap: list[tuple[float, str]] = []
+
+    def update(self, entity_id: str, state: State | None) -> None:
+        """Update the value of a member sensor."""
+        if state is not None:
+            self.stamp = max(self.stamp or 0, state.last_updated_timestamp)
+        try:
+            value = float(state.state) if state is not None else None
+        except ValueError:
+            value = None
+
+        if (old_value := self._values.pop(entity_id, None)) is not None:
+            self._sum -= old_value
+        if value is None:
+            return
+        self._values[entity_id] = value
+        self._sum += value
+        if self.function != AGGREGATE_MEAN:
+            heapq.heappush(self._heap, (self._sign * value, entity_id))
+            if len(self._heap) > 2 * len(self._values) + AGGREGATE_HEAP_SLACK:
+                self._rebuild()
+
+    def _rebuild(self) -> None:
+        """Drop outdated heap entries and sum drift."""
+        self._heap = [
+            (self._sign * value, entity_id) for entity_id, value in self._values.items()
+        ]
+        heapq.heapify(self._heap)
+        self._sum = sum(self._values.values())
+
+    @property
+    def value(self) -> float | None:
+        """Return the aggregated value, None if no sensor is available."""
+        if not self._values:
+            return None
+        if self.function == AGGREGATE_MEAN:
+            return self._sum / len(self._values)
+        while self._heap:
+            signed_value, entity_id = self._heap[0]
+            if self._values.get(entity_id) == self._sign * signed_value:
+                return self._sign * signed_value
+            heapq.heappop(self._heap)
+        return None
+
 
 class XDisplaySensorSync(XDisplaySync):
     """Sync between entity and X-Display sensor screen."""
 
+    deferrable = True
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -48,9 +134,61 @@ class XDisplaySensorSync(XDisplaySync):
 
         self.pub_topic_cmd = f"{self.topic_prefix}/{sensor_type}Cmd"
 
-        async_track_state_change_event(
-            hass, [screen_config[CONF_SCREEN_LINKED_ENTITY]], self.update_xdisplay
+        precision = screen_config.get(CONF_SCREEN_PRECISION)
+        self.precision: int | None = None if precision is None else int(precision)
+        self.deadband: float = float(screen_config.get(CONF_SCREEN_DEADBAND) or 0)
+        self.deadband_relative = (
+            screen_config.get(CONF_SCREEN_DEADBAND_MODE) == DEADBAND_MODE_RELATIVE
         )
+        self._last_value: float | None = None
+        self._last_payload: str | None = None
+
+        entity_ids = linked_entity_ids(screen_config)
+        self.aggregate: XDisplaySensorAggregate | None = None
+        self._template: Template | None = None
+        if screen_template := screen_config.get(CONF_SCREEN_TEMPLATE):
+            # Compiled once, rendered again only when its entities change
+            self._template = Template(screen_template, hass)
+            template_info = async_track_template_result(
+                hass,
+                [TrackTemplate(self._template, None)],
+                self.update_xdisplay_template,
+            )
+            config_entry.async_on_unload(template_info.async_remove)
+        elif len(entity_ids) > 1:
+            self.aggregate = XDisplaySensorAggregate(
+                screen_config.get(CONF_SCREEN_AGGREGATE) or AGGREGATE_MEAN
+            )
+            if self.precision is None:
+                self.precision = AGGREGATE_DEFAULT_PRECISION
+            for entity_id in entity_ids:
+                self.aggregate.update(entity_id, hass.states.get(entity_id))
+            self.async_track_entities(entity_ids, self.update_xdisplay_aggregate)
+        else:
+            self.async_track_entities(entity_ids, self.update_xdisplay)
+
+    async def async_refresh(self) -> None:
+        """Publish the current state of the linked entities or template."""
+        if self._template is not None:
+            # The tracker only reports results differing from the last one
+            try:
+                result = self._template.async_render(parse_result=False)
+            except TemplateError as err:
+                _LOGGER.warning(
+                    "Screen #%s: cannot render template: %s", self.screen_id, err
+                )
+                return
+            await self._async_publish_state(str(result))
+        elif self.aggregate is not None:
+            await self._async_publish_aggregate()
+        else:
+            await super().async_refresh()
+
+    async def async_resync(self) -> None:
+        """Publish again the value, even if shown by the screen."""
+        self._last_value = None
+        self._last_payload = None
+        await super().async_resync()
 
     async def update_xdisplay(self, event: Event[EventStateChangedData]) -> None:
         """Publish updated MQTT state from entity watched."""
@@ -64,11 +202,78 @@ class XDisplaySensorSync(XDisplaySync):
             event.data["entity_id"],
             to_state.state,
         )
-        await async_publish(
-            self.hass,
-            self.pub_topic_cmd,
-            to_state.state,
-        )
+        await self._async_publish_state(to_state.state)
+
+    async def update_xdisplay_aggregate(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Publish updated MQTT state from one of the entities aggregated."""
+        if self.aggregate is None:
+            return
+        self.aggregate.update(event.data["entity_id"], event.data["new_state"])
+        await self._async_publish_aggregate()
+
+    async def _async_publish_aggregate(self) -> None:
+        """Publish the aggregated value, if any sensor is available."""
+        if self.aggregate is None or (value := self.aggregate.value) is None:
+            return
+        await self._async_publish_state(str(value), stamp=self.aggregate.stamp)
+
+    async def update_xdisplay_template(
+        self,
+        _: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        """Publish updated MQTT state from template rendered."""
+        result = updates[-1].result
+        if isinstance(result, TemplateError):
+            _LOGGER.warning(
+                "Screen #%s: cannot render template: %s", self.screen_id, result
+            )
+            return
+        _LOGGER.debug("Screen #%s: template rendered %s", self.screen_id, result)
+        await self._async_publish_state(str(result))
+
+    async def _async_publish_state(
+        self, state: str, *, stamp: float | None = None
+    ) -> None:
+        """Publish a state, unless the screen would show the same value."""
+        value, payload = self._format_state(state)
+        if not self._should_publish(value, payload):
+            _LOGGER.debug(
+                "Screen #%s: %s within deadband of %s, not published",
+                self.screen_id,
+                payload,
+                self._last_payload,
+            )
+            self.mqtt.trace_dropped(self.pub_topic_cmd, payload, TRACE_DEADBAND)
+            return
+        # Kept only once accepted, an outdated state never reaches the screen
+        if await self.async_publish(self.pub_topic_cmd, payload, stamp=stamp):
+            self._last_value = value
+            self._last_payload = payload
+
+    def _format_state(self, state: str) -> tuple[float | None, str]:
+        """Return the numeric value and the payload shown on the screen."""
+        try:
+            value = float(state)
+        except ValueError:
+            return None, state
+        if self.precision is None:
+            return value, state
+        value = round(value, self.precision)
+        return value, f"{value:.{self.precision}f}"
+
+    def _should_publish(self, value: float | None, payload: str) -> bool:
+        """Check if the screen would show a different value."""
+        if payload == self._last_payload:
+            return False
+        if value is None or self._last_value is None or not self.deadband:
+            return True
+        threshold = self.deadband
+        if self.deadband_relative:
+            threshold = abs(self._last_value) * self.deadband / 100
+        return abs(value - self._last_value) >= threshold
 
     async def update_entity(self, msg: ReceiveMessage, action: str) -> None:
         """Read only."""
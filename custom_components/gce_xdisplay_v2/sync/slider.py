@@ -0,0 +1,120 @@
+"""Sync between entities and X-Display slider screens."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.light import ATTR_BRIGHTNESS, ATTR_BRIGHTNESS_PCT
+from homeassistant.const import STATE_ON, STATE_UNAVAILABLE, STATE_UNKNOWN
+
+from custom_components.gce_xdisplay_v2.const import (
+    CONF_SCREEN_LINKED_ENTITY,
+)
+
+from . import XDisplaySync
+
+if TYPE_CHECKING:
+    from homeassistant.components.mqtt.models import ReceiveMessage
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import Event, EventStateChangedData, HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+# Minimum delay between two brightness updates, in each direction
+SLIDER_RATE_LIMIT = 0.5
+
+
+class XDisplaySliderSync(XDisplaySync):
+    """Sync between light entity and X-Display slider screen."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        screen_id: int,
+        screen_config: dict[str, Any],
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(hass, config_entry, screen_id, screen_config)
+
+        self.topic_sub = f"{self.topic_prefix}/SliderState"
+        self.topic_pub = f"{self.topic_prefix}/SliderCmd"
+
+        # Only the latest value is kept, intermediate ones are dropped
+        self._target_brightness: int | None = None
+        self._published_brightness: int | None = None
+        self._light_debouncer = self.async_create_debouncer(
+            SLIDER_RATE_LIMIT, self._async_set_brightness, immediate=True
+        )
+        self._xdisplay_debouncer = self.async_create_debouncer(
+            SLIDER_RATE_LIMIT, self._async_publish_brightness, immediate=True
+        )
+
+        self.async_track_entities(
+            [screen_config[CONF_SCREEN_LINKED_ENTITY]], self.update_xdisplay
+        )
+
+    async def update_xdisplay(self, event: Event[EventStateChangedData]) -> None:
+        """Publish updated MQTT state from entity watched, rate limited."""
+        _LOGGER.debug("Watched entity %s has changed", event.data["entity_id"])
+        await self._xdisplay_debouncer.async_call()
+
+    async def _async_publish_brightness(self) -> None:
+        """Publish the current brightness of the light, in percent."""
+        state = self.hass.states.get(self.screen_config[CONF_SCREEN_LINKED_ENTITY])
+        if state is None or state.state in [STATE_UNAVAILABLE, STATE_UNKNOWN]:
+            return
+        brightness = 0
+        if state.state == STATE_ON:
+            brightness = round((state.attributes.get(ATTR_BRIGHTNESS) or 255) / 2.55)
+        if brightness == self._published_brightness:
+            return
+        if await self.async_publish(
+            self.topic_pub, brightness, stamp=state.last_updated_timestamp
+        ):
+            self._published_brightness = brightness
+
+    async def async_resync(self) -> None:
+        """Publish again the brightness, even if already published."""
+        self._published_brightness = None
+        await super().async_resync()
+
+    async def update_entity(self, msg: ReceiveMessage) -> None:
+        """Update the entity, rate limited."""
+        _LOGGER.debug("Action on XDisplay screen #%s: %s", self.screen_id, msg.payload)
+        try:
+            self._target_brightness = max(0, min(100, round(float(msg.payload))))
+        except ValueError:
+            _LOGGER.warning(
+                "Invalid brightness on XDisplay screen #%s: %s",
+                self.screen_id,
+                msg.payload,
+            )
+            return
+        await self._light_debouncer.async_call()
+
+    async def _async_set_brightness(self) -> None:
+        """Set the light to the latest brightness received."""
+        if (brightness := self._target_brightness) is None:
+            return
+        self._target_brightness = None
+        # The display already shows this value, don't publish it back
+        self._published_brightness = brightness
+        if brightness == 0:
+            self.async_call_service(
+                "light",
+                "turn_off",
+                {"entity_id": self.screen_config[CONF_SCREEN_LINKED_ENTITY]},
+                supersede="brightness",
+            )
+        else:
+            self.async_call_service(
+                "light",
+                "turn_on",
+                {
+                    "entity_id": self.screen_config[CONF_SCREEN_LINKED_ENTITY],
+                    ATTR_BRIGHTNESS_PCT: brightness,
+                },
+                supersede="brightness",
+            )
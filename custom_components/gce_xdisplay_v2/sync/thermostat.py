@@ -6,13 +6,9 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.climate.const import HVACAction, HVACMode
-from homeassistant.components.mqtt.client import async_publish
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.event import (
-    async_track_state_change_event,
-)
 
 from custom_components.gce_xdisplay_v2.const import (
     CONF_SCREEN_LINKED_ENTITY,
@@ -53,8 +49,8 @@ class XDisplayThermostatSync(XDisplaySync):
         # Not used, return the confirmation of the command
         self.sub_topic_target_temp_reply = f"{self.topic_prefix}/ThCmdReply"
 
-        async_track_state_change_event(
-            hass, [screen_config[CONF_SCREEN_LINKED_ENTITY]], self.update_xdisplay
+        self.async_track_entities(
+            [screen_config[CONF_SCREEN_LINKED_ENTITY]], self.update_xdisplay
         )
 
     async def update_xdisplay(self, event: Event[EventStateChangedData]) -> None:
@@ -65,28 +61,23 @@ class XDisplayThermostatSync(XDisplaySync):
         ]:
             return
         _LOGGER.debug(
-            "Watched entity %s has changed to %s (attributes: %s)",
+            "Watched entity %s has changed to %s",
             event.data["entity_id"],
             to_state.state,
-            to_state.attributes,
         )
-        await async_publish(
-            self.hass,
+        await self.async_publish(
             self.pub_topic_turned_on,
             1 if to_state.state == "heat" else 0,
         )
-        await async_publish(
-            self.hass,
+        await self.async_publish(
             self.pub_topic_heating,
             1 if to_state.attributes["hvac_action"] == HVACAction.HEATING else 0,
         )
-        await async_publish(
-            self.hass,
+        await self.async_publish(
             self.pub_topic_target_temp,
             to_state.attributes["temperature"],
         )
-        await async_publish(
-            self.hass,
+        await self.async_publish(
             self.pub_topic_measure_temp,
             to_state.attributes["current_temperature"],
         )
@@ -101,24 +92,26 @@ class XDisplayThermostatSync(XDisplaySync):
         )
         if action == "set_temperature":
             _LOGGER.debug("Setting temperature to %s", msg.payload)
-            await self.hass.services.async_call(
+            self.async_call_service(
                 "climate",
                 "set_temperature",
                 {
                     "entity_id": self.screen_config[CONF_SCREEN_LINKED_ENTITY],
                     "temperature": float(msg.payload),
                 },
+                supersede="set_temperature",
             )
         elif action == "set_hvac_mode":
             if msg.payload not in ("0", "1"):
                 _LOGGER.error("Invalid payload for HVAC mode: %s", msg.payload)
                 return
             _LOGGER.debug("Setting HVAC mode to %s", msg.payload)
-            await self.hass.services.async_call(
+            self.async_call_service(
                 "climate",
                 "set_hvac_mode",
                 {
                     "entity_id": self.screen_config[CONF_SCREEN_LINKED_ENTITY],
                     "hvac_mode": HVACMode.HEAT if msg.payload == "1" else HVACMode.OFF,
                 },
+                supersede="set_hvac_mode",
             )
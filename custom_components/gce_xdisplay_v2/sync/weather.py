@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import logging
+from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 
-from homeassistant.components.mqtt.client import async_publish
 from homeassistant.components.weather import (
     ATTR_CONDITION_CLEAR_NIGHT,
     ATTR_CONDITION_CLOUDY,
@@ -21,21 +21,35 @@ from homeassistant.components.weather import (
     ATTR_CONDITION_SUNNY,
     ATTR_CONDITION_WINDY,
     ATTR_CONDITION_WINDY_VARIANT,
+    SERVICE_GET_FORECASTS,
+)
+from homeassistant.components.weather import (
+    DOMAIN as WEATHER_DOMAIN,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import SUN_EVENT_SUNRISE, SUN_EVENT_SUNSET, Platform
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.event import (
     async_track_state_change_event,
+    async_track_time_change,
+    async_track_time_interval,
 )
+from homeassistant.helpers.sun import get_astral_event_date
+from homeassistant.util import dt as dt_util
 
 from custom_components.gce_xdisplay_v2.const import (
     CONF_SCREEN_LINKED_ENTITY,
+    DATA_FORECAST_CACHE,
 )
 
 from . import XDisplaySync
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
+    from datetime import datetime
+
     from homeassistant.components.mqtt.models import ReceiveMessage
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import Event, EventStateChangedData, HomeAssistant
@@ -44,14 +58,119 @@ PLATFORMS = [Platform.SENSOR, Platform.SWITCH, Platform.NUMBER]
 
 _LOGGER = logging.getLogger(__name__)
 
+FORECAST_REFRESH_INTERVAL = timedelta(minutes=30)
+# Minimum delay between two fetches triggered by weather state changes
+FORECAST_REFRESH_COOLDOWN = 600
+FORECAST_DAYS = 3
+
+
+class XDisplayForecastCache:
+    """Daily forecast shared by every weather screen showing the same entity."""
+
+    def __init__(self, hass: HomeAssistant, entity_id: str) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self.entity_id = entity_id
+        self.forecast: list[dict[str, Any]] | None = None
+
+        self._listeners: list[Callable[[], Coroutine[Any, Any, None]]] = []
+        self._unsubs: list[CALLBACK_TYPE] = []
+        self._debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=FORECAST_REFRESH_COOLDOWN,
+            immediate=True,
+            function=self.async_refresh,
+        )
+
+    @callback
+    def async_add_listener(
+        self, update_callback: Callable[[], Coroutine[Any, Any, None]]
+    ) -> CALLBACK_TYPE:
+        """Listen for forecast updates, fetching it on first listener."""
+        self._listeners.append(update_callback)
+
+        if len(self._listeners) == 1:
+            self._unsubs = [
+                async_track_time_interval(
+                    self.hass, self._async_interval_refresh, FORECAST_REFRESH_INTERVAL
+                ),
+                async_track_state_change_event(
+                    self.hass, [self.entity_id], self._async_state_changed
+                ),
+            ]
+            self._debouncer.async_schedule_call()
+        elif self.forecast is not None:
+            self.hass.async_create_task(update_callback())
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener, and the cache once unused."""
+            self._listeners.remove(update_callback)
+            if self._listeners:
+                return
+            for unsub in self._unsubs:
+                unsub()
+            self._unsubs = []
+            self._debouncer.async_cancel()
+            self.hass.data[DATA_FORECAST_CACHE].pop(self.entity_id, None)
+
+        return remove_listener
+
+    async def _async_interval_refresh(self, _: datetime) -> None:
+        """Refresh the forecast on schedule."""
+        await self._debouncer.async_call()
+
+    @callback
+    def _async_state_changed(self, _: Event[EventStateChangedData]) -> None:
+        """Refresh the forecast when the weather entity is updated."""
+        self._debouncer.async_schedule_call()
+
+    async def async_refresh(self) -> None:
+        """Fetch the daily forecast and notify listeners if it changed."""
+        try:
+            response = await self.hass.services.async_call(
+                WEATHER_DOMAIN,
+                SERVICE_GET_FORECASTS,
+                {"entity_id": self.entity_id, "type": "daily"},
+                blocking=True,
+                return_response=True,
+            )
+        except HomeAssistantError as err:
+            _LOGGER.debug("Cannot get forecast of %s: %s", self.entity_id, err)
+            return
+
+        forecast = (response or {}).get(self.entity_id, {}).get("forecast", [])
+        if forecast == self.forecast:
+            return
+        _LOGGER.debug("Forecast of %s updated", self.entity_id)
+        self.forecast = forecast
+        for listener in list(self._listeners):
+            await listener()
+
+
+@callback
+def async_get_forecast_cache(
+    hass: HomeAssistant, entity_id: str
+) -> XDisplayForecastCache:
+    """Get the forecast cache of a weather entity."""
+    caches: dict[str, XDisplayForecastCache] = hass.data.setdefault(
+        DATA_FORECAST_CACHE, {}
+    )
+    if (cache := caches.get(entity_id)) is None:
+        cache = caches[entity_id] = XDisplayForecastCache(hass, entity_id)
+    return cache
+
 
 class XDisplayWeatherSync(XDisplaySync):
     """Sync between entity and X-Display weather screen."""
 
+    deferrable = True
+
     def __init__(
         self,
         hass: HomeAssistant,
-        config_entry: ConfigEntry[Any],
+        config_entry: ConfigEntry,
         screen_id: int,
         screen_config: dict[str, Any],
     ) -> None:
@@ -73,12 +192,30 @@ class XDisplayWeatherSync(XDisplaySync):
         self.pub_topic_level_d2 = f"{self.topic_prefix}/WhLevelD2"
         self.pub_topic_temp_d3 = f"{self.topic_prefix}/WhtempD3"
         self.pub_topic_level_d3 = f"{self.topic_prefix}/WhLevelD3"
+        self.pub_topics_forecast = [
+            (self.pub_topic_temp_d1, self.pub_topic_level_d1),
+            (self.pub_topic_temp_d2, self.pub_topic_level_d2),
+            (self.pub_topic_temp_d3, self.pub_topic_level_d3),
+        ]
 
-        async_track_state_change_event(
-            hass, [screen_config[CONF_SCREEN_LINKED_ENTITY]], self.update_xdisplay
+        self.async_track_entities(
+            [screen_config[CONF_SCREEN_LINKED_ENTITY]], self.update_xdisplay
         )
 
-    def convert_weather_level(self, level: str) -> int:
+        self.forecast_cache = async_get_forecast_cache(
+            hass, screen_config[CONF_SCREEN_LINKED_ENTITY]
+        )
+        config_entry.async_on_unload(
+            self.forecast_cache.async_add_listener(self.update_xdisplay_forecast)
+        )
+        # Days and sun times shift at midnight, even with an unchanged forecast
+        config_entry.async_on_unload(
+            async_track_time_change(
+                hass, self._async_new_day, hour=0, minute=0, second=0
+            )
+        )
+
+    def convert_weather_level(self, level: str | None) -> int:
         """Convert weather level to X-Display level."""
         level_mapping = {
             ATTR_CONDITION_SUNNY: 0,
@@ -117,31 +254,69 @@ class XDisplayWeatherSync(XDisplaySync):
             to_state.attributes["wind_speed"],
             to_state.attributes["pressure"],
         )
-        await async_publish(
-            self.hass,
+        await self.async_publish(
             self.pub_topic_hum,
             to_state.attributes["humidity"],
         )
-        await async_publish(
-            self.hass,
+        await self.async_publish(
             self.pub_topic_temp,
             to_state.attributes["temperature"],
         )
-        await async_publish(
-            self.hass,
+        await self.async_publish(
             self.pub_topic_wind,
             to_state.attributes["wind_speed"],
         )
-        await async_publish(
-            self.hass,
+        await self.async_publish(
             self.pub_topic_level,
             self.convert_weather_level(to_state.state),
         )
-        await async_publish(
-            self.hass,
+        await self.async_publish(
             self.pub_topic_pressure,
             to_state.attributes["pressure"],
         )
 
+    async def async_refresh(self) -> None:
+        """Publish the current conditions and the cached forecast."""
+        await super().async_refresh()
+        if self.forecast_cache.forecast:
+            await self.update_xdisplay_forecast()
+
+    async def _async_new_day(self, _: datetime) -> None:
+        """Publish the forecast of the next days and today's sun times."""
+        if self.forecast_cache.forecast is not None:
+            await self.update_xdisplay_forecast()
+
+    async def update_xdisplay_forecast(self) -> None:
+        """Publish cached daily forecast and sun times."""
+        today = dt_util.now().date()
+        days = [
+            day
+            for day in self.forecast_cache.forecast or []
+            if (day_datetime := dt_util.parse_datetime(day["datetime"])) is not None
+            and dt_util.as_local(day_datetime).date() > today
+        ][:FORECAST_DAYS]
+        _LOGGER.debug("Screen #%s: publishing forecast %s", self.screen_id, days)
+
+        for (topic_temp, topic_level), day in zip(
+            self.pub_topics_forecast, days, strict=False
+        ):
+            # Partial forecasts keep the last value shown
+            if (temperature := day.get("temperature")) is not None:
+                await self.async_publish(topic_temp, temperature)
+            if (condition := day.get("condition")) is not None:
+                await self.async_publish(
+                    topic_level, self.convert_weather_level(condition)
+                )
+
+        for topic, sun_event in (
+            (self.pub_topic_sunrise, SUN_EVENT_SUNRISE),
+            (self.pub_topic_sunset, SUN_EVENT_SUNSET),
+        ):
+            if (event_time := get_astral_event_date(self.hass, sun_event)) is None:
+                continue
+            await self.async_publish(
+                topic, dt_util.as_local(event_time).strftime("%H:%M")
+            )
+
     async def update_entity(self, msg: ReceiveMessage, action: str) -> None:
         """Read only."""